@@ -8,11 +8,17 @@ import sys
 from pathlib import Path
 
 # Add utils to path
-sys.path.append(str(Path(__file__).parent))
+app_dir = str(Path(__file__).parent)
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
 
-from utils.engine import VerbEngine
+from utils import startup
+startup.begin_page("Home")
+
+from utils.engine import get_shared_engine
 from utils.srs import SRSManager
-from utils.io import load_verbs, load_conjugations, load_patterns, load_phrases
+
+startup.page_imported("Home")
 
 # Page config
 st.set_page_config(
@@ -57,7 +63,7 @@ st.markdown("""
 
 # Initialize session state
 if 'engine' not in st.session_state:
-    st.session_state.engine = VerbEngine()
+    st.session_state.engine = get_shared_engine()
     st.session_state.srs = SRSManager()
     
 if 'user_progress' not in st.session_state:
@@ -211,3 +217,6 @@ st.markdown("""
     <p><small>Works fully offline after first load • PWA available at GitHub Pages</small></p>
 </div>
 """, unsafe_allow_html=True)
+
+startup.end_page("Home")
+startup.render_sidebar(st)
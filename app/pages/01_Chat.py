@@ -3,20 +3,31 @@ Chat page - Interactive verb tutor chatbot
 """
 
 import streamlit as st
+import re
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
+app_dir = str(Path(__file__).parent.parent)
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
 
-from utils.engine import VerbEngine
-from utils.io import load_phrases
+from utils import startup
+startup.begin_page("Chat")
+
+from utils.engine import VerbEngine, get_shared_engine
+from utils.phrases import PhraseIndex, get_shared_phrases
+
+startup.page_imported("Chat")
 
 st.set_page_config(page_title="Chat - SpanishVerb Tutor", page_icon="💬", layout="wide")
 
+CEFR_LEVELS = {'A1', 'A2', 'B1', 'B2', 'C1', 'C2'}
+# A message that is just one word, or "what is <word>", may be a form to identify
+FORM_QUESTION = re.compile(r"(?:what is |what's )?([a-záéíóúüñ]+)")
+
 # Initialize
 if 'engine' not in st.session_state:
-    st.session_state.engine = VerbEngine()
-    st.session_state.engine.initialize()
+    st.session_state.engine = get_shared_engine()
 
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
@@ -25,9 +36,6 @@ if 'chat_history' not in st.session_state:
         'content': '¡Hola! I\'m your Spanish verb tutor. Ask me about conjugations, see examples, or start a quiz! Try: "conjugate hablar in present"'
     })
 
-if 'phrases' not in st.session_state:
-    st.session_state.phrases = load_phrases()
-
 # Page header
 st.title("💬 Chat with Your Tutor")
 st.markdown("Ask questions about verbs, conjugations, and usage!")
@@ -49,7 +57,7 @@ if prompt := st.chat_input("Ask me anything... e.g., 'conjugate ser in present'"
         st.markdown(prompt)
     
     # Process and respond
-    response = process_message(prompt, st.session_state.engine, st.session_state.phrases)
+    response = process_message(prompt, st.session_state.engine, get_shared_phrases())
     
     st.session_state.chat_history.append({'role': 'assistant', 'content': response})
     
@@ -79,7 +87,7 @@ with st.sidebar:
     """)
 
 
-def process_message(message: str, engine: VerbEngine, phrases: list) -> str:
+def process_message(message: str, engine: VerbEngine, phrases: PhraseIndex) -> str:
     """Process user message and generate response"""
     msg = message.lower().strip()
     
@@ -90,6 +98,8 @@ def process_message(message: str, engine: VerbEngine, phrases: list) -> str:
         return handle_example(msg, engine, phrases)
     elif any(word in msg for word in ['quiz', 'test', 'practice']):
         return "Great! Let me start a quiz for you. Check out the **Drills** page from the sidebar! 🎯"
+    elif identified := handle_identify(msg, engine):
+        return identified
     elif any(word in msg for word in ['explain', 'what is', 'difference']):
         return handle_explain(msg)
     else:
@@ -104,27 +114,14 @@ What would you like to learn?"""
 
 def handle_conjugate(msg: str, engine: VerbEngine) -> str:
     """Handle conjugation request"""
-    # Extract verb
-    verbs = ['ser', 'estar', 'tener', 'hacer', 'poder', 'ir', 'ver', 'dar', 'saber', 'querer',
-             'hablar', 'comer', 'vivir', 'estudiar', 'trabajar', 'escribir', 'leer']
-    
-    verb = None
-    for v in verbs:
-        if v in msg:
-            verb = v
-            break
+    # Extract verb and tense in one pass
+    found = engine.find_verbs(msg)
+    verb = found['verb']
     
     if not verb:
         return "Which verb would you like me to conjugate? Try: 'conjugate hablar in present'"
     
-    # Extract tense
-    tense = 'presente'
-    if 'preterite' in msg or 'pretérito' in msg or 'past' in msg:
-        tense = 'pretérito'
-    elif 'imperfect' in msg or 'imperfecto' in msg:
-        tense = 'imperfecto'
-    elif 'future' in msg or 'futuro' in msg:
-        tense = 'futuro'
+    tense = found['tense'] or 'presente'
     
     # Conjugate
     result = engine.conjugate(verb, tense)
@@ -145,31 +142,46 @@ def handle_conjugate(msg: str, engine: VerbEngine) -> str:
     return response
 
 
-def handle_example(msg: str, engine: VerbEngine, phrases: list) -> str:
+def handle_identify(msg: str, engine: VerbEngine) -> str:
+    """Explain a conjugated form asked about on its own, e.g. "tengo" or "what is fuimos?"
+
+    Returns "" unless the message is a bare form or a "what is" question
+    about one, so ordinary sentences fall through to the help text.
+    """
+    question = FORM_QUESTION.fullmatch(msg.strip(' ¿?¡!.,'))
+    if not question:
+        return ""
+    
+    word = question.group(1)
+    matches = engine.identify_form(word)
+    if not matches:
+        return ""
+    
+    response = f"**{word}** can be:\n"
+    for match in matches:
+        verb = engine.get_verb(match['infinitive'])
+        tense_label = engine.get_tense_info(match['tense'])['label']
+        person_label = engine.get_person_label(match['person'])
+        response += f"- **{verb['infinitive']}** ({verb['english']}) - {tense_label}, {person_label}\n"
+    
+    return response
+
+
+def handle_example(msg: str, engine: VerbEngine, phrases: PhraseIndex) -> str:
     """Handle example sentence request"""
     # Extract verb
-    verbs = ['ser', 'estar', 'tener', 'hacer', 'poder', 'ir', 'ver', 'dar', 'saber', 'querer',
-             'hablar', 'comer', 'vivir', 'estudiar', 'trabajar', 'escribir', 'leer']
-    
-    verb = None
-    for v in verbs:
-        if v in msg:
-            verb = v
-            break
+    verb = engine.find_verbs(msg)['verb']
     
     if not verb:
         return "Which verb would you like to see in a sentence?"
     
-    # Find phrases
-    verb_phrases = [p for p in phrases if p['infinitive'] == verb]
+    # Show 3 random examples, at the CEFR level named in the message if any
+    level = next((word.upper() for word in msg.split() if word.upper() in CEFR_LEVELS), None)
+    examples = phrases.sample(verb, 3, level)
     
-    if not verb_phrases:
+    if not examples:
         return f"I don't have example sentences for '{verb}' yet."
     
-    # Show 3 random examples
-    import random
-    examples = random.sample(verb_phrases, min(3, len(verb_phrases)))
-    
     response = f"**Examples using {verb}**:\n\n"
     for i, ex in enumerate(examples, 1):
         response += f"{i}. **{ex['spanish_sentence']}**\n"
@@ -216,3 +228,6 @@ def handle_explain(msg: str) -> str:
 - **Preterite vs Imperfect**: "explain preterite vs imperfect"
 
 What would you like to know about?"""
+
+startup.end_page("Chat")
+startup.render_sidebar(st)
@@ -8,17 +8,23 @@ from pathlib import Path
 import random
 from datetime import datetime
 
-sys.path.append(str(Path(__file__).parent.parent))
+app_dir = str(Path(__file__).parent.parent)
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
 
-from utils.engine import VerbEngine
+from utils import startup
+startup.begin_page("Drills")
+
+from utils.engine import get_shared_engine
 from utils.srs import SRSManager
 
+startup.page_imported("Drills")
+
 st.set_page_config(page_title="Drills - SpanishVerb Tutor", page_icon="🎯", layout="wide")
 
 # Initialize
 if 'engine' not in st.session_state:
-    st.session_state.engine = VerbEngine()
-    st.session_state.engine.initialize()
+    st.session_state.engine = get_shared_engine()
 
 if 'srs' not in st.session_state:
     st.session_state.srs = SRSManager()
@@ -107,25 +113,29 @@ def start_drill(mode: str, count: int):
     """Start a new drill"""
     engine = st.session_state.engine
     
-    # Generate questions
+    # Generate questions (spare verbs stand in for ones that cannot be asked)
     questions = []
-    verbs = engine.get_random_verbs(count, tags='basic,common,core')
+    verbs = engine.get_random_verbs(count * 2, tags='basic,common,core')
     tenses = ['presente', 'pretérito', 'imperfecto']
     persons = engine.patterns['persons']
     
-    for verb in verbs:
-        tense = random.choice(tenses)
-        person = random.choice(persons)
+    # Conjugate the correct answers in one batch
+    picks = [(verb, random.choice(tenses), random.choice(persons)) for verb in verbs]
+    forms = engine.conjugate_many(
+        (verb['infinitive'], tense, person) for verb, tense, person in picks
+    )
+    
+    for (verb, tense, person), correct_form in zip(picks, forms):
+        if len(questions) >= count:
+            break
         
-        correct_answer = engine.conjugate(verb['infinitive'], tense, person)
+        picked = pick_question(engine, verb['infinitive'], tense, person, correct_form, tenses, persons)
+        if not picked:
+            continue
+        tense, person, correct_form, distractors = picked
         
-        # Generate wrong options
-        options = [correct_answer['form']]
-        while len(options) < 4:
-            random_person = random.choice(persons)
-            wrong_form = engine.conjugate(verb['infinitive'], tense, random_person)
-            if wrong_form and wrong_form['form'] not in options:
-                options.append(wrong_form['form'])
+        # Wrong options come from the engine's precomputed distractor pools
+        options = [correct_form] + distractors
         
         random.shuffle(options)
         
@@ -141,7 +151,7 @@ def start_drill(mode: str, count: int):
             'person_label': person_label,
             'question': f"What is the {tense_info['label']} form of '{verb['infinitive']}' ({verb['english']}) for {person_label}?",
             'options': options,
-            'correct': correct_answer['form']
+            'correct': correct_form
         })
     
     st.session_state.drill_state = {
@@ -154,6 +164,27 @@ def start_drill(mode: str, count: int):
     }
 
 
+def pick_question(engine, infinitive: str, tense: str, person: str, correct_form: str,
+                  tenses: list, persons: list):
+    """Return (tense, person, correct_form, distractors) for a multiple-choice question.
+
+    Forms the engine only knows as the bare infinitive (e.g. reflexive verbs)
+    or that have fewer than 3 distractors are re-picked from the verb's other
+    tense/person combinations; returns None if none of them works.
+    """
+    combos = [(t, p) for t in tenses for p in persons if (t, p) != (tense, person)]
+    random.shuffle(combos)
+    
+    for t, p in [(tense, person)] + combos:
+        form = correct_form if (t, p) == (tense, person) else engine.get_form(infinitive, t, p)
+        if not form or form == infinitive:
+            continue
+        distractors = engine.get_distractors(infinitive, t, p)
+        if len(distractors) >= 3:
+            return t, p, form, distractors
+    return None
+
+
 def show_question(drill: dict):
     """Display current question"""
     question = drill['questions'][drill['current_index']]
@@ -263,3 +294,6 @@ def show_results(drill: dict):
     with col3:
         if st.button("📊 View Progress", use_container_width=True):
             st.switch_page("pages/04_Progress.py")
+
+startup.end_page("Drills")
+startup.render_sidebar(st)
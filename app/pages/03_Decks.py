@@ -6,17 +6,27 @@ import streamlit as st
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
+app_dir = str(Path(__file__).parent.parent)
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
 
-from utils.engine import VerbEngine
+from utils import startup
+startup.begin_page("Decks")
+
+from utils.engine import get_shared_engine
+from utils.srs import SRSManager
 from utils.io import export_to_csv, import_from_csv
 
+startup.page_imported("Decks")
+
 st.set_page_config(page_title="Decks - SpanishVerb Tutor", page_icon="📚", layout="wide")
 
 # Initialize
 if 'engine' not in st.session_state:
-    st.session_state.engine = VerbEngine()
-    st.session_state.engine.initialize()
+    st.session_state.engine = get_shared_engine()
+
+if 'srs' not in st.session_state:
+    st.session_state.srs = SRSManager()
 
 if 'custom_decks' not in st.session_state:
     st.session_state.custom_decks = []
@@ -132,7 +142,7 @@ with tab2:
         else:
             deck = {
                 'name': deck_name,
-                'verbs': selected_verbs if select_by == "Individual" else [v['infinitive'] for v in filtered_verbs],
+                'verbs': [v.split(' (')[0] for v in selected_verbs] if select_by == "Individual" else [v['infinitive'] for v in filtered_verbs],
                 'tenses': tenses,
                 'created': st.session_state.get('deck_count', 0) + 1
             }
@@ -153,6 +163,7 @@ with tab2:
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("🎯 Practice", key=f"practice_{i}"):
+                        st.session_state.srs.add_cards_bulk(deck, st.session_state.engine.patterns['persons'])
                         st.session_state['practice_deck'] = deck
                         st.switch_page("pages/02_Drills.py")
                 
@@ -226,3 +237,6 @@ with tab3:
             st.session_state['deck_count'] = st.session_state.get('deck_count', 0) + 1
             st.success(f"✅ Imported deck '{import_name}'!")
             st.rerun()
+
+startup.end_page("Decks")
+startup.render_sidebar(st)
@@ -7,10 +7,17 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
-sys.path.append(str(Path(__file__).parent.parent))
+app_dir = str(Path(__file__).parent.parent)
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
+
+from utils import startup
+startup.begin_page("Progress")
 
 from utils.srs import SRSManager
 
+startup.page_imported("Progress")
+
 st.set_page_config(page_title="Progress - SpanishVerb Tutor", page_icon="📊", layout="wide")
 
 # Initialize
@@ -142,6 +149,16 @@ with col1:
     days_to_complete = round((190 - learned) / verbs_per_session)
     
     st.info(f"At {daily_minutes} minutes/day, you'll master all verbs in approximately **{days_to_complete} days**!")
+    
+    # Projected SRS reviews for the next two weeks
+    forecast = st.session_state.srs.forecast(14)
+    if any(forecast['due']):
+        st.markdown("#### Upcoming Reviews")
+        st.bar_chart(
+            {'Day': forecast['dates'], 'Reviews': forecast['due']},
+            x='Day', y='Reviews', use_container_width=True
+        )
+        st.caption(f"Busiest day: {max(forecast['due'])} reviews")
 
 with col2:
     st.markdown("#### Exam Preparation")
@@ -264,3 +281,6 @@ with col4:
         st.success("🔥 7-Day Streak")
     else:
         st.caption("🔒 7-Day Streak")
+
+startup.end_page("Progress")
+startup.render_sidebar(st)
@@ -0,0 +1,170 @@
+"""
+Build the web app's data bundles (web/data/*.min.json) from content/
+
+Run from the app directory:
+    python -m utils.build
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .engine import VerbEngine
+from .io import CONTENT_FILES, ContentRegistry, atomic_writer
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+CONTENT_DIR = ROOT_DIR / "content"
+OUTPUT_DIR = ROOT_DIR / "web" / "data"
+MANIFEST = "manifest.json"
+
+VERB_GROUPS = {'ar', 'er', 'ir', 'irregular'}
+CEFR_LEVELS = {'A1', 'A2', 'B1', 'B2', 'C1', 'C2'}
+CACHE_NAME_RE = re.compile(r"const CACHE_NAME = '[^']*';")
+
+
+def validate(registry: ContentRegistry) -> Tuple[List[str], List[str]]:
+    """Check the content for broken rows; returns (errors, warnings)"""
+    errors = []
+    warnings = []
+    
+    # Short rows get None values, long rows an extra None key
+    for name, (filename, _) in CONTENT_FILES.items():
+        data = registry.get(name)
+        if isinstance(data, list):
+            for line, row in enumerate(data, 2):
+                if None in row or None in row.values():
+                    errors.append(f"{filename}:{line}: wrong number of columns")
+    
+    patterns = registry.get('patterns')
+    tenses = set(patterns.get('tenses', []))
+    persons = set(patterns.get('persons', []))
+    
+    infinitives = set()
+    for line, verb in enumerate(registry.get('verbs'), 2):
+        infinitive = verb.get('infinitive') or ''
+        if infinitive in infinitives:
+            errors.append(f"verbs.csv:{line}: duplicate verb '{infinitive}'")
+        infinitives.add(infinitive)
+        if verb.get('irregular') not in ('yes', 'no'):
+            errors.append(f"verbs.csv:{line}: irregular must be yes or no")
+        if verb.get('group') not in VERB_GROUPS:
+            errors.append(f"verbs.csv:{line}: unknown group '{verb.get('group')}'")
+    
+    for line, conj in enumerate(registry.get('conjugations'), 2):
+        if conj.get('infinitive') not in infinitives:
+            errors.append(f"conjugations.csv:{line}: unknown verb '{conj.get('infinitive')}'")
+        if conj.get('tense') not in tenses:
+            errors.append(f"conjugations.csv:{line}: unknown tense '{conj.get('tense')}'")
+        if conj.get('person') not in persons:
+            errors.append(f"conjugations.csv:{line}: unknown person '{conj.get('person')}'")
+        if not conj.get('form'):
+            errors.append(f"conjugations.csv:{line}: empty form")
+    
+    for line, phrase in enumerate(registry.get('phrases'), 2):
+        if phrase.get('infinitive') not in infinitives:
+            warnings.append(f"phrases.csv:{line}: unknown verb '{phrase.get('infinitive')}'")
+        if phrase.get('level') not in CEFR_LEVELS:
+            warnings.append(f"phrases.csv:{line}: unknown level '{phrase.get('level')}'")
+    
+    if errors:
+        return errors, warnings
+    
+    # Every verb must conjugate in every tense through the real engine
+    engine = VerbEngine(registry=registry)
+    engine.initialize()
+    for infinitive in sorted(infinitives):
+        for tense in sorted(tenses):
+            forms = engine.paradigms.get(infinitive, {}).get(tense, {})
+            missing = [p for p in persons if not forms.get(p)]
+            if missing:
+                errors.append(f"{infinitive} {tense}: no form for {', '.join(missing)}")
+    
+    return errors, warnings
+
+
+def bundle(data) -> bytes:
+    """Minified JSON, as the web app loads it"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_if_changed(path: Path, payload: bytes) -> bool:
+    """Atomically write payload unless the file already has the same content"""
+    try:
+        if hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(payload).digest():
+            return False
+    except OSError:
+        pass
+    
+    with atomic_writer(path, binary=True) as f:
+        f.write(payload)
+    return True
+
+
+def build(content_dir: Path = CONTENT_DIR, output_dir: Path = OUTPUT_DIR) -> Dict:
+    """Validate content and write changed bundles plus the hash manifest.
+    
+    The manifest version is also stamped into the service worker's cache
+    name (service-worker.js next to the output directory). Raises
+    ValueError if the content has errors. Returns the manifest:
+    {'version': ..., 'files': {filename: sha256}}.
+    """
+    registry = ContentRegistry(content_dir)
+    registry.load()
+    
+    errors, warnings = validate(registry)
+    for warning in warnings:
+        print(f"Warning: {warning}")
+    if errors:
+        for error in errors:
+            print(f"Error: {error}")
+        raise ValueError(f"{len(errors)} content error(s)")
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    payloads = {f"{name}.min.json": bundle(registry.get(name)) for name in CONTENT_FILES}
+    
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        written = dict(zip(payloads, pool.map(
+            lambda item: write_if_changed(output_dir / item[0], item[1]), payloads.items()
+        )))
+    
+    for filename, changed in written.items():
+        print(f"{'✓ Wrote' if changed else '  Unchanged'} {filename}")
+    
+    files = {filename: hashlib.sha256(payload).hexdigest() for filename, payload in payloads.items()}
+    version = hashlib.sha256(''.join(files[f] for f in sorted(files)).encode()).hexdigest()[:12]
+    manifest = {'version': version, 'files': files}
+    if write_if_changed(output_dir / MANIFEST, json.dumps(manifest, indent=2).encode('utf-8') + b'\n'):
+        print(f"✓ Wrote {MANIFEST} (version {version})")
+    
+    # A new cache name makes browsers install the new service worker and drop old data
+    service_worker = output_dir.parent / "service-worker.js"
+    if service_worker.exists():
+        script = service_worker.read_text(encoding='utf-8')
+        stamped = CACHE_NAME_RE.sub(f"const CACHE_NAME = 'spanishverb-{version}';", script, count=1)
+        if write_if_changed(service_worker, stamped.encode('utf-8')):
+            print(f"✓ Updated {service_worker.name} cache name")
+    
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build web/data bundles from content/")
+    parser.add_argument('--content', type=Path, default=CONTENT_DIR, help="content directory")
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help="output directory")
+    args = parser.parse_args()
+    
+    try:
+        build(args.content, args.output)
+    except ValueError as e:
+        print(f"Build failed: {e}")
+        sys.exit(1)
+    print("\n✓ Build completed successfully!")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,81 +3,456 @@ Verb conjugation engine for Python/Streamlit
 """
 
 import json
+import re
+import threading
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Content registry files the engine is built from
+ENGINE_CONTENT = {'verbs', 'conjugations', 'patterns'}
+# Wrong answers every multiple-choice question needs
+MIN_DISTRACTORS = 3
+
+
+class EngineTables:
+    """Everything the engine derives from one version of the content.
+    
+    A build is never modified after construction (apart from caching its
+    chat matcher), so VerbEngine can swap in a new one with a single
+    assignment and a method that reads it once sees consistent tables.
+    """
+    
+    def __init__(self, verbs: List[Dict], conjugations: Dict[str, str], patterns: Dict,
+                 previous: 'EngineTables' = None):
+        """Build all tables; steps whose inputs are unchanged from previous are reused"""
+        self.verbs = verbs
+        self.conjugations = conjugations
+        self.patterns = patterns
+        
+        if previous is not None and previous.verbs is verbs:
+            self.verb_index = previous.verb_index
+            self.group_index = previous.group_index
+            self.irregular_index = previous.irregular_index
+            self.tag_index = previous.tag_index
+        else:
+            self._build_indexes()
+        
+        if previous is not None and previous.verbs is verbs and previous.patterns is patterns:
+            self.stem_rules = previous.stem_rules
+            self.spelling_rules = previous.spelling_rules
+            self.verb_rules = previous.verb_rules
+        else:
+            self._build_rules()
+        
+        self._build_paradigms()
+        self._build_distractors()
+        self._matcher = None
+    
+    def _build_indexes(self):
+        """Index verbs by infinitive, group, irregularity and tag"""
+        # Values are positions in self.verbs
+        verb_index: Dict[str, int] = {}
+        group_index: Dict[str, Set[int]] = {}
+        irregular_index: Dict[str, Set[int]] = {}
+        tag_index: Dict[str, Set[int]] = {}
+        
+        for i, verb in enumerate(self.verbs):
+            verb_index[verb['infinitive'].lower()] = i
+            group_index.setdefault(verb.get('group', ''), set()).add(i)
+            irregular_index.setdefault(verb.get('irregular', ''), set()).add(i)
+            for tag in _split_tags(verb.get('tags', '')):
+                tag_index.setdefault(tag, set()).add(i)
+        
+        self.verb_index = verb_index
+        self.group_index = group_index
+        self.irregular_index = irregular_index
+        self.tag_index = tag_index
+    
+    def _build_rules(self):
+        """Compile stem/spelling rule tables from patterns and resolve them per verb"""
+        self.stem_rules = [
+            _compile_rule(name, rule)
+            for name, rule in self.patterns.get('stem_changes', {}).items()
+            if 'match' in rule
+        ]
+        self.spelling_rules = [
+            _compile_rule(name, rule)
+            for name, rule in self.patterns.get('spelling_changes', {}).items()
+            if 'match' in rule
+        ]
+        # infinitive -> compiled stem/spelling rules that apply to it
+        self.verb_rules: Dict[str, Dict] = {
+            verb['infinitive']: self._resolve_rules(verb['infinitive'])
+            for verb in self.verbs
+        }
+    
+    def _resolve_rules(self, infinitive: str) -> Dict:
+        """Pick the stem-change rule and spelling rules for one verb"""
+        stem = next((r for r in self.stem_rules if infinitive in r['verbs']), None)
+        spelling = [r for r in self.spelling_rules if infinitive.endswith(r['suffixes'])]
+        return {'stem': stem, 'spelling': spelling}
+    
+    def _build_paradigms(self):
+        """Precompute every verb x tense x person form"""
+        tenses = list(self.patterns.get('tenses', []))
+        for key in self.conjugations:
+            tense = key.split(':')[1]
+            if tense not in tenses:
+                tenses.append(tense)
+        persons = self.patterns.get('persons', [])
+        
+        # infinitive -> tense -> person -> form
+        paradigms: Dict[str, Dict[str, Dict[str, str]]] = {}
+        # lowercased form -> every (infinitive, tense, person) that produces it
+        form_index: Dict[str, List[Tuple[str, str, str]]] = {}
+        # Same, keyed by normalize_answer(form) for accent-insensitive grading
+        normalized_index: Dict[str, List[Tuple[str, str, str]]] = {}
+        for verb in self.verbs:
+            infinitive = verb['infinitive']
+            # Rules applied to a stem of under two letters (ir, ser, ver, dar) give
+            # junk like "a", "as" or "de"; only their overrides are worth identifying
+            stemless = len(infinitive) < 4
+            table = {}
+            for tense in tenses:
+                row = {}
+                for p in persons:
+                    form = self.derive_form(verb, tense, p)
+                    row[p] = form
+                    normalized_index.setdefault(normalize_answer(form), []).append((infinitive, tense, p))
+                    # Tenses without endings fall back to the bare infinitive
+                    if form == infinitive:
+                        continue
+                    if stemless and not self._stem_free(infinitive, tense, p):
+                        continue
+                    form_index.setdefault(form.lower(), []).append((infinitive, tense, p))
+                table[tense] = row
+            paradigms[infinitive] = table
+        
+        self.paradigms = paradigms
+        self.form_index = form_index
+        self.normalized_index = normalized_index
+    
+    def _stem_free(self, infinitive: str, tense: str, person: str) -> bool:
+        """Whether a form comes from an override or the whole infinitive, not the stem"""
+        return f"{infinitive}:{tense}:{person}" in self.conjugations or tense in ('futuro', 'condicional')
+    
+    def _build_distractors(self):
+        """Precompute multiple-choice distractor pools for every verb x tense x person.
+        
+        Preferred distractors are the other persons of the same tense plus
+        common errors (the regularized form and the form without accents);
+        the fallback pool is the same person in other tenses. Where those
+        give fewer than MIN_DISTRACTORS (e.g. forms the engine only knows
+        as the bare infinitive), the fallback is topped up with the same
+        tense and person of other verbs.
+        """
+        # tense -> person -> real forms of every verb, for the cross-verb top-up;
+        # tense None holds the person's forms in any tense (for tenses with no endings)
+        shared = {}
+        for infinitive, table in self.paradigms.items():
+            for tense, row in table.items():
+                for person, form in row.items():
+                    if form != infinitive:
+                        shared.setdefault(tense, {}).setdefault(person, []).append(form)
+                        shared.setdefault(None, {}).setdefault(person, []).append(form)
+        
+        # infinitive -> tense -> person -> (preferred, fallback) wrong answers
+        distractors: Dict[str, Dict[str, Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]]] = {}
+        for i, verb in enumerate(self.verbs):
+            infinitive = verb['infinitive']
+            table = self.paradigms.get(infinitive, {})
+            pools = {}
+            for tense, row in table.items():
+                pools[tense] = {}
+                for person, correct in row.items():
+                    preferred = [f for f in row.values() if f != correct]
+                    regularized = self.generate_conjugation(verb, tense, person)
+                    preferred.append(regularized)
+                    plain = normalize_answer(correct)
+                    if plain != correct.lower():
+                        preferred.append(plain)
+                    fallback = [r[person] for t, r in table.items() if t != tense]
+                    
+                    preferred = _distinct_wrong(preferred, correct, infinitive)
+                    fallback = _distinct_wrong(fallback, correct, infinitive, exclude=preferred)
+                    
+                    missing = MIN_DISTRACTORS - len(preferred) - len(fallback)
+                    if missing > 0:
+                        # Start at a different verb for each verb so the extras vary
+                        candidates = []
+                        for others in (shared.get(tense, {}).get(person, []),
+                                       shared.get(None, {}).get(person, [])):
+                            start = i % len(others) if others else 0
+                            candidates += others[start:] + others[:start]
+                        extra = _distinct_wrong(candidates, correct, infinitive,
+                                                exclude=preferred + fallback)
+                        fallback += extra[:missing]
+                    pools[tense][person] = (tuple(preferred), tuple(fallback))
+            distractors[infinitive] = pools
+        
+        self.distractors = distractors
+    
+    def matcher(self):
+        """The chat keyword matcher over these verbs, irregular forms and tense words (built once)"""
+        if self._matcher is None:
+            from .matcher import build_verb_matcher
+            
+            # Only override forms: regular ones such as "use" (usar) or "come"
+            # (comer) are too often English. Forms that are also an infinitive
+            # (e.g. "ser") are left to that verb.
+            forms = {}
+            for key, form in self.conjugations.items():
+                if form.lower() not in self.verb_index:
+                    forms.setdefault(form.lower(), key.split(':')[0])
+            self._matcher = build_verb_matcher(self.verb_index, forms.items())
+        return self._matcher
+    
+    def verb(self, infinitive: str) -> Optional[Dict]:
+        """Get a verb by infinitive"""
+        i = self.verb_index.get(infinitive.lower())
+        return self.verbs[i] if i is not None else None
+    
+    def form(self, infinitive: str, tense: str, person: str) -> Optional[str]:
+        """Get a single conjugated form, or None for an unknown verb"""
+        form = self.paradigms.get(infinitive.lower(), {}).get(tense, {}).get(person)
+        if form is not None:
+            return form
+        
+        verb = self.verb(infinitive)
+        if not verb:
+            return None
+        return self.derive_form(verb, tense, person)
+    
+    def conjugate_form(self, verb: Dict, tense: str, person: str) -> str:
+        """Get conjugated form for specific verb/tense/person"""
+        form = self.paradigms.get(verb['infinitive'], {}).get(tense, {}).get(person)
+        if form is not None:
+            return form
+        return self.derive_form(verb, tense, person)
+    
+    def derive_form(self, verb: Dict, tense: str, person: str) -> str:
+        """Derive a form from overrides and rules, bypassing the paradigm table"""
+        # Check for override
+        key = f"{verb['infinitive']}:{tense}:{person}"
+        if key in self.conjugations:
+            return self.conjugations[key]
+        
+        # Generate from patterns
+        return self.generate_conjugation(verb, tense, person)
+    
+    def generate_conjugation(self, verb: Dict, tense: str, person: str) -> str:
+        """Generate conjugation using patterns"""
+        infinitive = verb['infinitive']
+        ending = infinitive[-2:]
+        stem = infinitive[:-2]
+        
+        # Get regular ending
+        regular_endings = self.patterns['regular_endings'].get(ending, {})
+        if tense not in regular_endings:
+            return infinitive
+        
+        ending_suffix = regular_endings[tense].get(person, '')
+        
+        # For future/conditional, use full infinitive
+        if tense in ['futuro', 'condicional']:
+            return infinitive + ending_suffix
+        
+        rules = self.verb_rules.get(infinitive) or self._resolve_rules(infinitive)
+        
+        # Apply stem changes (e→ie, o→ue, etc.)
+        rule = rules['stem']
+        if rule and tense in rule['tenses'] and person in rule['persons']:
+            stem = rule['regex'].sub(rule['replace'], stem, count=1)
+        
+        # Apply orthographic spelling changes
+        for rule in rules['spelling']:
+            if tense in rule['tenses'] and person in rule['persons']:
+                stem = rule['regex'].sub(rule['replace'], stem, count=1)
+                break
+        
+        return stem + ending_suffix
 
 
 class VerbEngine:
-    def __init__(self, content_dir: str = "content"):
+    def __init__(self, content_dir: str = "content", registry=None):
         self.content_dir = Path(content_dir)
-        self.verbs: List[Dict] = []
-        self.conjugations: Dict[str, str] = {}
-        self.patterns: Dict = {}
+        # ContentRegistry to load from (default: the process-wide one)
+        self.registry = registry
+        # Current build of all derived tables; replaced as a whole, never modified.
+        # Methods read it once into a local so a concurrent refresh cannot mix builds.
+        self._tables = EngineTables([], {}, {})
         self.initialized = False
-        
+    
+    @property
+    def verbs(self) -> List[Dict]:
+        """Verb rows from verbs.csv"""
+        return self._tables.verbs
+    
+    @property
+    def conjugations(self) -> Dict[str, str]:
+        """Conjugation overrides, infinitive:tense:person -> form"""
+        return self._tables.conjugations
+    
+    @property
+    def patterns(self) -> Dict:
+        """Rules and labels from patterns.json"""
+        return self._tables.patterns
+    
+    @property
+    def paradigms(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """infinitive -> tense -> person -> form"""
+        return self._tables.paradigms
+    
     def initialize(self):
         """Load all verb data"""
         if self.initialized:
             return
-            
+        
         try:
-            from .io import load_verbs, load_conjugations, load_patterns
-            
-            self.verbs = load_verbs()
-            conjugations_list = load_conjugations()
-            self.patterns = load_patterns()
-            
-            # Build conjugations lookup
-            for conj in conjugations_list:
-                key = f"{conj['infinitive']}:{conj['tense']}:{conj['person']}"
-                self.conjugations[key] = conj['form']
+            registry = self._get_registry()
+            registry.load()
+            self._tables = EngineTables(
+                registry.get('verbs'),
+                _conjugation_table(registry.get('conjugations')),
+                registry.get('patterns')
+            )
             
             self.initialized = True
-            print(f"✓ VerbEngine initialized with {len(self.verbs)} verbs")
+            print(f"✓ VerbEngine initialized with {len(self._tables.verbs)} verbs")
         except Exception as e:
             print(f"Failed to initialize VerbEngine: {e}")
             raise
     
+    def reload(self):
+        """Re-read all content and rebuild every table (the old ones serve until then)"""
+        self.initialized = False
+        self._get_registry().invalidate()
+        self.initialize()
+    
+    def refresh(self, changed: Iterable[str]) -> bool:
+        """Rebuild what depends on the changed content files and swap it in.
+        
+        changed holds content registry names (e.g. ['conjugations']); the
+        registry must already hold their new data. Only those files are
+        re-read and only the dependent steps re-run (verb indexes for
+        verbs.csv, rule tables for verbs/patterns, always the paradigm
+        table, distractors and matcher). The new EngineTables is installed
+        with a single assignment, so concurrent lookups see either the old
+        or the new build. Returns True if anything changed.
+        """
+        changed = set(changed) & ENGINE_CONTENT
+        if not changed or not self.initialized:
+            return False
+        
+        registry = self._get_registry()
+        current = self._tables
+        self._tables = EngineTables(
+            registry.get('verbs') if 'verbs' in changed else current.verbs,
+            _conjugation_table(registry.get('conjugations')) if 'conjugations' in changed
+            else current.conjugations,
+            registry.get('patterns') if 'patterns' in changed else current.patterns,
+            previous=current
+        )
+        print(f"✓ VerbEngine refreshed ({', '.join(sorted(changed))})")
+        return True
+    
+    def _get_registry(self):
+        """The content registry this engine loads from"""
+        if self.registry is None:
+            from .io import get_registry
+            return get_registry()
+        return self.registry
+    
+    def get_distractors(self, infinitive: str, tense: str, person: str,
+                        count: int = 3) -> List[str]:
+        """Sample up to count wrong answers for a multiple-choice question"""
+        import random
+        if not self.initialized:
+            self.initialize()
+        
+        pools = self._tables.distractors.get(infinitive.lower(), {}).get(tense, {}).get(person)
+        if not pools:
+            return []
+        
+        preferred, fallback = pools
+        if len(preferred) >= count:
+            return random.sample(preferred, count)
+        return list(preferred) + random.sample(fallback, min(count - len(preferred), len(fallback)))
+    
+    def get_matcher(self):
+        """Get the chat keyword matcher over all verbs, irregular forms and tense words"""
+        if not self.initialized:
+            self.initialize()
+        
+        return self._tables.matcher()
+    
+    def find_verbs(self, text: str) -> Dict:
+        """Find the verb and tense mentioned in a chat message.
+        
+        Infinitives win over conjugated forms and the earliest mention wins.
+        A more specific tense beats "present" ("present subjunctive").
+        Returns {'verb': infinitive or None, 'tense': tense or None}.
+        """
+        verb = form_verb = tense = None
+        for _, _, (kind, value) in self.get_matcher().find(text):
+            if kind == 'verb' and verb is None:
+                verb = value
+            elif kind == 'form' and form_verb is None:
+                form_verb = value
+            elif kind == 'tense' and tense in (None, 'presente'):
+                tense = value
+        return {'verb': verb or form_verb, 'tense': tense}
+    
     def get_verb(self, infinitive: str) -> Optional[Dict]:
         """Get verb by infinitive"""
         if not self.initialized:
             self.initialize()
         
-        infinitive = infinitive.lower()
-        for verb in self.verbs:
-            if verb['infinitive'] == infinitive:
-                return verb
-        return None
+        return self._tables.verb(infinitive)
     
     def get_verbs(self, **filters) -> List[Dict]:
         """Get verbs with filters"""
         if not self.initialized:
             self.initialize()
         
-        result = list(self.verbs)
-        
+        tables = self._tables
+        candidates = []
         if 'group' in filters:
-            result = [v for v in result if v.get('group') == filters['group']]
+            candidates.append(tables.group_index.get(filters['group'], set()))
         if 'irregular' in filters:
             is_irregular = 'yes' if filters['irregular'] else 'no'
-            result = [v for v in result if v.get('irregular') == is_irregular]
+            candidates.append(tables.irregular_index.get(is_irregular, set()))
         if 'tags' in filters:
-            tags = filters['tags'].split(',')
-            result = [v for v in result if any(tag in v.get('tags', '') for tag in tags)]
+            tagged = set()
+            for tag in _split_tags(filters['tags']):
+                tagged |= tables.tag_index.get(tag, set())
+            candidates.append(tagged)
         
-        return result
+        if not candidates:
+            return list(tables.verbs)
+        
+        # Intersect smallest-first and keep the original verb order
+        candidates.sort(key=len)
+        matches = set(candidates[0])
+        for posting in candidates[1:]:
+            matches &= posting
+        
+        return [tables.verbs[i] for i in sorted(matches)]
     
     def conjugate(self, infinitive: str, tense: str, person: Optional[str] = None) -> Dict:
         """Conjugate a verb"""
         if not self.initialized:
             self.initialize()
         
-        verb = self.get_verb(infinitive)
+        tables = self._tables
+        verb = tables.verb(infinitive)
         if not verb:
             return None
         
         if person:
-            form = self._conjugate_form(verb, tense, person)
+            form = tables.conjugate_form(verb, tense, person)
             return {
                 'form': form,
                 'verb': verb,
@@ -86,10 +461,11 @@ class VerbEngine:
             }
         
         # All persons
-        persons = self.patterns['persons']
-        forms = {}
-        for p in persons:
-            forms[p] = self._conjugate_form(verb, tense, p)
+        row = tables.paradigms.get(verb['infinitive'], {}).get(tense)
+        if row is not None:
+            forms = dict(row)
+        else:
+            forms = {p: tables.conjugate_form(verb, tense, p) for p in tables.patterns['persons']}
         
         return {
             'forms': forms,
@@ -97,112 +473,92 @@ class VerbEngine:
             'tense': tense
         }
     
-    def _conjugate_form(self, verb: Dict, tense: str, person: str) -> str:
-        """Get conjugated form for specific verb/tense/person"""
-        # Check for override
-        key = f"{verb['infinitive']}:{tense}:{person}"
-        if key in self.conjugations:
-            return self.conjugations[key]
-        
-        # Generate from patterns
-        return self._generate_conjugation(verb, tense, person)
-    
-    def _generate_conjugation(self, verb: Dict, tense: str, person: str) -> str:
-        """Generate conjugation using patterns"""
-        infinitive = verb['infinitive']
-        ending = infinitive[-2:]
-        stem = infinitive[:-2]
+    def conjugate_many(self, triples: Iterable[Tuple[str, str, str]]) -> List[Optional[str]]:
+        """Conjugate many (infinitive, tense, person) triples in one pass.
         
-        # Get regular ending
-        regular_endings = self.patterns['regular_endings'].get(ending, {})
-        if tense not in regular_endings:
-            return infinitive
-        
-        ending_suffix = regular_endings[tense].get(person, '')
-        
-        # For future/conditional, use full infinitive
-        if tense in ['futuro', 'condicional']:
-            return infinitive + ending_suffix
-        
-        # Apply stem changes for present tense
-        if tense in ['presente', 'presente_subjuntivo']:
-            stem = self._apply_stem_change(stem, verb, person)
+        Returns the forms in input order, with None for unknown verbs.
+        """
+        if not self.initialized:
+            self.initialize()
         
-        # Apply spelling changes
-        stem = self._apply_spelling_changes(stem, verb, tense, person, ending)
+        tables = self._tables
+        cache = {}
+        results = []
+        for infinitive, tense, person in triples:
+            key = infinitive.lower()
+            table = cache.get(key)
+            if table is None:
+                verb = tables.verb(key)
+                table = cache[key] = (verb, tables.paradigms.get(key, {})) if verb else (None, {})
+            
+            verb, paradigm = table
+            if verb is None:
+                results.append(None)
+                continue
+            
+            form = paradigm.get(tense, {}).get(person)
+            results.append(form if form is not None else tables.derive_form(verb, tense, person))
         
-        return stem + ending_suffix
+        return results
     
-    def _apply_stem_change(self, stem: str, verb: Dict, person: str) -> str:
-        """Apply stem changes (e→ie, o→ue, etc.)"""
-        affected_persons = ['yo', 'tú', 'él', 'ellos']
-        if person not in affected_persons:
-            return stem
-        
-        infinitive = verb['infinitive']
-        
-        # e → ie
-        if infinitive in ['pensar', 'querer', 'sentir', 'empezar', 'comenzar', 'cerrar',
-                         'despertar', 'recomendar', 'entender', 'perder']:
-            import re
-            return re.sub(r'e([^e]*)$', r'ie\1', stem)
+    def conjugate_grid(self, infinitives: Iterable[str],
+                       tenses: Iterable[str]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Conjugate every person of every verb x tense combination.
         
-        # o → ue
-        if infinitive in ['poder', 'volver', 'dormir', 'encontrar', 'contar', 'costar',
-                         'mostrar', 'probar', 'recordar', 'mover', 'doler']:
-            import re
-            return re.sub(r'o([^o]*)$', r'ue\1', stem)
-        
-        # e → i
-        if infinitive in ['pedir', 'servir', 'seguir', 'conseguir']:
-            import re
-            return re.sub(r'e([^e]*)$', r'i\1', stem)
+        Returns infinitive -> tense -> person -> form; unknown verbs are skipped.
+        """
+        if not self.initialized:
+            self.initialize()
         
-        # u → ue (jugar only)
-        if infinitive == 'jugar':
-            return stem.replace('u', 'ue', 1)
+        tables = self._tables
+        tenses = list(tenses)
+        persons = tables.patterns['persons']
+        grid = {}
+        for infinitive in infinitives:
+            verb = tables.verb(infinitive)
+            if not verb:
+                continue
+            
+            paradigm = tables.paradigms.get(verb['infinitive'], {})
+            rows = {}
+            for tense in tenses:
+                row = paradigm.get(tense)
+                if row is not None:
+                    rows[tense] = dict(row)
+                else:
+                    rows[tense] = {p: tables.derive_form(verb, tense, p) for p in persons}
+            grid[verb['infinitive']] = rows
         
-        return stem
+        return grid
     
-    def _apply_spelling_changes(self, stem: str, verb: Dict, tense: str, 
-                                person: str, ending: str) -> str:
-        """Apply orthographic spelling changes"""
-        infinitive = verb['infinitive']
-        
-        # c → qu before e
-        if infinitive.endswith('car') and tense == 'pretérito' and person == 'yo':
-            return stem[:-1] + 'qu'
-        
-        # g → gu before e
-        if infinitive.endswith('gar') and tense == 'pretérito' and person == 'yo':
-            return stem[:-1] + 'gu'
-        
-        # z → c before e
-        if infinitive.endswith('zar') and tense == 'pretérito' and person == 'yo':
-            return stem[:-1] + 'c'
-        
-        # cer/cir → zco
-        if (infinitive.endswith('cer') or infinitive.endswith('cir')) and \
-           tense == 'presente' and person == 'yo':
-            if len(stem) > 0 and stem[-1] in 'aeiou':
-                return stem + 'z'
+    def identify_form(self, form: str) -> List[Dict]:
+        """Find every verb/tense/person a conjugated form could be"""
+        if not self.initialized:
+            self.initialize()
         
-        # guir → go
-        if infinitive.endswith('guir') and tense == 'presente' and person == 'yo':
-            return stem[:-1]
+        return [
+            {'infinitive': infinitive, 'tense': tense, 'person': person}
+            for infinitive, tense, person in self._tables.form_index.get(form.strip().lower(), [])
+        ]
+    
+    def get_form(self, infinitive: str, tense: str, person: str) -> Optional[str]:
+        """Get a single conjugated form, or None for an unknown verb"""
+        if not self.initialized:
+            self.initialize()
         
-        return stem
+        return self._tables.form(infinitive, tense, person)
     
     def get_tense_info(self, tense: str) -> Dict:
         """Get tense label and explanation"""
+        patterns = self._tables.patterns
         return {
-            'label': self.patterns.get('tense_labels', {}).get(tense, tense),
-            'explanation': self.patterns.get('tense_explanations', {}).get(tense, '')
+            'label': patterns.get('tense_labels', {}).get(tense, tense),
+            'explanation': patterns.get('tense_explanations', {}).get(tense, '')
         }
     
     def get_person_label(self, person: str) -> str:
         """Get person label in English"""
-        return self.patterns.get('person_labels', {}).get(person, person)
+        return self._tables.patterns.get('person_labels', {}).get(person, person)
     
     def get_random_verbs(self, count: int, **filters) -> List[Dict]:
         """Get random verbs with optional filters"""
@@ -211,14 +567,13 @@ class VerbEngine:
         random.shuffle(verbs)
         return verbs[:min(count, len(verbs))]
     
-    def validate_conjugation(self, infinitive: str, tense: str, person: str, 
+    def validate_conjugation(self, infinitive: str, tense: str, person: str,
                            user_answer: str) -> Dict:
         """Validate user's conjugation answer"""
-        verb = self.get_verb(infinitive)
-        if not verb:
+        correct = self.get_form(infinitive, tense, person)
+        if correct is None:
             return {'correct': False, 'expected': '', 'provided': user_answer}
         
-        correct = self._conjugate_form(verb, tense, person)
         normalized = user_answer.strip().lower()
         
         return {
@@ -226,3 +581,103 @@ class VerbEngine:
             'expected': correct,
             'provided': user_answer
         }
+    
+    def grade_answer(self, infinitive: str, tense: str, person: str,
+                     user_answer: str) -> Dict:
+        """Grade an answer as exact, accent-only error, wrong person, wrong tense or wrong"""
+        if not self.initialized:
+            self.initialize()
+        
+        tables = self._tables
+        expected = tables.form(infinitive, tense, person)
+        if expected is None:
+            return {'correct': False, 'grade': 'wrong', 'expected': '', 'provided': user_answer}
+        
+        result = {'correct': False, 'grade': 'wrong', 'expected': expected, 'provided': user_answer}
+        if user_answer.strip().lower() == expected.lower():
+            result.update(correct=True, grade='exact')
+            return result
+        
+        infinitive = infinitive.lower()
+        hits = [
+            (t, p) for inf, t, p in tables.normalized_index.get(normalize_answer(user_answer), [])
+            if inf == infinitive
+        ]
+        if (tense, person) in hits:
+            result['grade'] = 'accent'
+        elif any(t == tense for t, _ in hits):
+            result['grade'] = 'wrong_person'
+        elif hits:
+            result['grade'] = 'wrong_tense'
+        return result
+
+
+_shared_engine: Optional[VerbEngine] = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_shared_engine() -> VerbEngine:
+    """Get the process-wide engine, loading content on first use.
+    
+    The engine is shared by every session in the server process and must
+    be treated as read-only. A content watcher refreshes it in place when
+    content files change.
+    """
+    global _shared_engine
+    
+    engine = _shared_engine
+    if engine is not None:
+        return engine
+    
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            engine = VerbEngine()
+            engine.initialize()
+            _shared_engine = engine
+            
+            # Pick up edits to the content files while the server runs
+            from .watcher import start_content_watcher
+            start_content_watcher(engine)
+        return _shared_engine
+
+
+def _conjugation_table(rows: List[Dict]) -> Dict[str, str]:
+    """Key conjugation overrides as "infinitive:tense:person" -> form"""
+    return {f"{r['infinitive']}:{r['tense']}:{r['person']}": r['form'] for r in rows}
+
+
+def _split_tags(tags: str) -> List[str]:
+    """Split a tags field such as "basic,common" into individual tags"""
+    return [t for t in re.split(r'[,;\s]+', tags.strip().lower()) if t]
+
+
+def _distinct_wrong(forms: List[str], correct: str, infinitive: str, 
+                    exclude: Iterable[str] = ()) -> List[str]:
+    """Drop duplicates, the correct answer and infinitive placeholders"""
+    skip = {correct.lower(), infinitive.lower()} | {f.lower() for f in exclude}
+    result = []
+    for form in forms:
+        if form and form.lower() not in skip:
+            skip.add(form.lower())
+            result.append(form)
+    return result
+
+
+def _compile_rule(name: str, rule: Dict) -> Dict:
+    """Compile a declarative rule from patterns.json"""
+    apply = rule.get('apply', {})
+    return {
+        'name': name,
+        'regex': re.compile(rule['match']),
+        'replace': rule.get('replace', ''),
+        'verbs': frozenset(rule.get('verbs', [])),
+        'suffixes': tuple(rule.get('suffixes', [])),
+        'tenses': frozenset(apply.get('tenses', [])),
+        'persons': frozenset(apply.get('persons', [])),
+    }
+
+
+def normalize_answer(text: str) -> str:
+    """Case-fold and strip accents, e.g. "Comí " -> "comi" """
+    decomposed = unicodedata.normalize('NFD', text.strip())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
@@ -3,13 +3,34 @@ I/O utilities for loading content data
 """
 
 import csv
+import gzip
+import hashlib
+import io
 import json
+import os
+import pickle
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict
+from stat import S_IMODE
+from typing import IO, Any, Callable, Iterable, Iterator, List, Dict, Sequence, Tuple
 
+# Parsed content is cached next to the sources so restarts skip CSV/JSON parsing
+SNAPSHOT_DIR = ".snapshot"
+SNAPSHOT_VERSION = 1
 
+# Process umask, for giving new files the permissions open() would (mkstemp uses 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@lru_cache(maxsize=None)
 def get_content_dir() -> Path:
-    """Get content directory path"""
+    """Get content directory path (resolved once per process)"""
     # Try app/content first, then fall back to ../content
     app_content = Path(__file__).parent.parent / "content"
     if app_content.exists():
@@ -31,13 +52,7 @@ def load_csv(filename: str) -> List[Dict]:
         print(f"Warning: {filepath} not found")
         return []
     
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    
-    return data
+    return load_with_snapshot(filepath, _parse_csv)
 
 
 def load_json(filename: str) -> Dict:
@@ -49,77 +64,333 @@ def load_json(filename: str) -> Dict:
         print(f"Warning: {filepath} not found")
         return {}
     
+    return load_with_snapshot(filepath, _parse_json)
+
+
+def _parse_csv(filepath: Path) -> List[Dict]:
+    """Parse a CSV file into a list of dictionaries"""
+    data = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            data.append(row)
+    return data
+
+
+def _parse_json(filepath: Path) -> Dict:
+    """Parse a JSON file"""
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def load_with_snapshot(filepath: Path, parser: Callable[[Path], Any]) -> Any:
+    """Load a content file through its compiled snapshot.
+
+    The snapshot is reused while the source's mtime and size are unchanged,
+    or when its content hash still matches (e.g. after a fresh checkout).
+    Otherwise the source is parsed again and the snapshot rewritten.
+    """
+    snapshot_path = filepath.parent / SNAPSHOT_DIR / f"{filepath.name}.pickle"
+    stat = filepath.stat()
+    
+    snapshot = _read_snapshot(snapshot_path)
+    if snapshot and snapshot['mtime_ns'] == stat.st_mtime_ns and snapshot['size'] == stat.st_size:
+        return snapshot['data']
+    
+    raw = filepath.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot and snapshot['sha256'] == digest:
+        data = snapshot['data']
+    else:
+        data = parser(filepath)
+    
+    _write_snapshot(snapshot_path, {
+        'version': SNAPSHOT_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': digest,
+        'data': data
+    })
+    return data
+
+
+def _read_snapshot(snapshot_path: Path) -> Dict:
+    """Read a snapshot file, or return {} if missing, stale or unreadable"""
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return {}
+    
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        return {}
+    return snapshot
+
+
+def _write_snapshot(snapshot_path: Path, snapshot: Dict):
+    """Atomically write a snapshot file; failures only cost the cache"""
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        snapshot_path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"Warning: could not write snapshot {snapshot_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+# Content files known to the registry: name -> (filename, parser)
+CONTENT_FILES = {
+    'verbs': ('verbs.csv', _parse_csv),
+    'conjugations': ('conjugations.csv', _parse_csv),
+    'patterns': ('patterns.json', _parse_json),
+    'phrases': ('phrases.csv', _parse_csv),
+    'prompts': ('prompts.json', _parse_json),
+}
+
+
+class ContentRegistry:
+    """Parsed content files, loaded once and shared by the engine and pages.
+    
+    The content directory is resolved once; load() parses files in a
+    thread pool. Returned data is shared between callers, so treat it as
+    read-only. refresh() re-reads only the files whose mtime or size
+    changed since they were loaded.
+    """
+    
+    def __init__(self, content_dir: Path = None, max_workers: int = None):
+        self.content_dir = Path(content_dir) if content_dir else get_content_dir()
+        self.max_workers = max_workers or len(CONTENT_FILES)
+        self._data: Dict[str, Any] = {}
+        # name -> (mtime_ns, size) of the file when it was read
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def load(self, names: Iterable[str] = None):
+        """Load the named files (default: all) that are not loaded yet, concurrently"""
+        names = [name for name in (names or CONTENT_FILES) if name not in self._data]
+        if not names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as pool:
+            results = list(pool.map(self._read, names))
+        
+        with self._lock:
+            for name, (signature, data) in zip(names, results):
+                if name not in self._data:
+                    self._data[name] = data
+                    self._signatures[name] = signature
+    
+    def get(self, name: str) -> Any:
+        """Get one parsed file, loading it on first use"""
+        if name not in self._data:
+            signature, data = self._read(name)
+            with self._lock:
+                if name not in self._data:
+                    self._data[name] = data
+                    self._signatures[name] = signature
+        return self._data[name]
+    
+    def invalidate(self, names: Iterable[str] = None):
+        """Forget loaded files (default: all) so the next access re-reads them"""
+        with self._lock:
+            for name in list(names or CONTENT_FILES):
+                self._data.pop(name, None)
+                self._signatures.pop(name, None)
+    
+    def changed(self) -> List[str]:
+        """Names of loaded files that changed on disk since they were read"""
+        return [
+            name for name, signature in list(self._signatures.items())
+            if self._stat(name) != signature
+        ]
+    
+    def refresh(self) -> List[str]:
+        """Re-read changed files and swap in their new data; returns their names.
+        
+        Each file is replaced in one assignment, so readers get either the
+        old or the new data.
+        """
+        reloaded = []
+        for name in self.changed():
+            if not (self.content_dir / CONTENT_FILES[name][0]).exists():
+                # Missing (e.g. mid delete-then-write save): keep the old data and
+                # signature, so the file is re-read as soon as it is back
+                continue
+            try:
+                signature, data = self._read(name)
+            except (ValueError, KeyError, csv.Error) as e:
+                # Half-saved or broken file: keep serving the old data until the next edit
+                print(f"Warning: could not reload {CONTENT_FILES[name][0]}: {e}")
+                self._signatures[name] = self._stat(name)
+                continue
+            with self._lock:
+                self._data[name] = data
+                self._signatures[name] = signature
+            reloaded.append(name)
+        return reloaded
+    
+    def _stat(self, name: str) -> Tuple[int, int]:
+        """(mtime_ns, size) of a content file, or (0, 0) if it is missing"""
+        try:
+            stat = (self.content_dir / CONTENT_FILES[name][0]).stat()
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read(self, name: str) -> Tuple[Tuple[int, int], Any]:
+        """Parse one content file through its snapshot; returns (signature, data)"""
+        filename, parser = CONTENT_FILES[name]
+        filepath = self.content_dir / filename
+        # Stat before reading so an edit made during the read is picked up next time
+        signature = self._stat(name)
+        
+        if not filepath.exists():
+            print(f"Warning: {filepath} not found")
+            return signature, [] if parser is _parse_csv else {}
+        
+        return signature, load_with_snapshot(filepath, parser)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ContentRegistry:
+    """Get the process-wide content registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ContentRegistry()
+    return _registry
+
+
 def load_verbs() -> List[Dict]:
     """Load verbs from CSV"""
-    return load_csv('verbs.csv')
+    return get_registry().get('verbs')
 
 
 def load_conjugations() -> List[Dict]:
     """Load conjugations from CSV"""
-    return load_csv('conjugations.csv')
+    return get_registry().get('conjugations')
 
 
 def load_patterns() -> Dict:
     """Load conjugation patterns from JSON"""
-    return load_json('patterns.json')
+    return get_registry().get('patterns')
 
 
 def load_phrases() -> List[Dict]:
     """Load example phrases from CSV"""
-    return load_csv('phrases.csv')
+    return get_registry().get('phrases')
 
 
 def load_prompts() -> Dict:
     """Load quiz prompts from JSON"""
-    return load_json('prompts.json')
+    return get_registry().get('prompts')
 
 
-def save_csv(filename: str, data: List[Dict]):
-    """Save data to CSV file"""
-    if not data:
-        return
+@contextmanager
+def atomic_writer(filepath, binary: bool = False, compress: bool = None) -> Iterator[IO]:
+    """Open a temp file next to filepath and move it into place on success.
     
-    content_dir = get_content_dir()
-    filepath = content_dir / filename
+    The data is fsynced before os.replace(), so readers see either the old
+    file or the complete new one, never a truncated one. compress gzips the
+    output (default: when the name ends in .gz). On error the temp file is
+    removed and the original is left untouched.
+    """
+    filepath = Path(filepath)
+    if compress is None:
+        compress = filepath.suffix == '.gz'
+    # A unique name, so a temp file left by a crash never blocks later saves
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix='.tmp')
+    tmp_path = Path(tmp_name)
+    
+    raw = os.fdopen(fd, 'wb')
+    try:
+        stream = gzip.GzipFile(filename=filepath.stem, mode='wb', fileobj=raw) if compress else raw
+        f = stream if binary else io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        yield f
+        
+        f.flush()
+        if f is not stream:
+            f.detach()
+        if stream is not raw:
+            stream.close()
+        raw.flush()
+        os.fsync(raw.fileno())
+        raw.close()
+        
+        if filepath.exists():
+            os.chmod(tmp_path, S_IMODE(filepath.stat().st_mode))
+        else:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        raw.close()
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_csv(filepath, rows: Iterable[Dict], fieldnames: Sequence[str] = None, 
+              compress: bool = None) -> int:
+    """Stream rows to a CSV file atomically; returns the number of rows written.
     
-    fieldnames = data[0].keys()
+    Rows can be any iterable (e.g. a generator) and are written one at a
+    time. Without fieldnames the first row's keys are used; with no rows
+    and no fieldnames nothing is written.
+    """
+    rows = iter(rows)
+    if fieldnames is None:
+        first = next(rows, None)
+        if first is None:
+            return 0
+        fieldnames = list(first.keys())
+        rows = chain([first], rows)
     
-    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+    count = 0
+    with atomic_writer(filepath, compress=compress) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(data)
-    
-    print(f"✓ Saved {len(data)} rows to {filename}")
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
 
 
-def save_json(filename: str, data: Dict):
-    """Save data to JSON file"""
-    content_dir = get_content_dir()
-    filepath = content_dir / filename
+def save_csv(filename: str, data: Iterable[Dict], fieldnames: Sequence[str] = None, 
+             compress: bool = None):
+    """Save rows to a CSV file in the content directory (atomic, streaming)"""
+    filepath = get_content_dir() / filename
+    count = write_csv(filepath, data, fieldnames, compress)
+    if count or fieldnames:
+        print(f"✓ Saved {count} rows to {filename}")
+
+
+def save_json(filename: str, data: Dict, compress: bool = None):
+    """Save data to a JSON file in the content directory (atomic)"""
+    filepath = get_content_dir() / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
+    with atomic_writer(filepath, compress=compress) as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     
     print(f"✓ Saved to {filename}")
 
 
-def export_to_csv(data: List[Dict], output_path: str):
-    """Export data to CSV file at specified path"""
-    if not data:
-        return
-    
-    fieldnames = data[0].keys()
-    
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
-    
-    print(f"✓ Exported to {output_path}")
+def export_to_csv(data: Iterable[Dict], output_path: str, fieldnames: Sequence[str] = None, 
+                  compress: bool = None):
+    """Export rows to a CSV file at specified path (atomic, streaming)"""
+    count = write_csv(output_path, data, fieldnames, compress)
+    if count or fieldnames:
+        print(f"✓ Exported to {output_path}")
 
 
 def import_from_csv(filepath: str) -> List[Dict]:
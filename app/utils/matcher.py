@@ -0,0 +1,124 @@
+"""
+Multi-pattern keyword matcher (Aho-Corasick) for the chat intent parser
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Words in a chat message that select a tense
+TENSE_KEYWORDS = {
+    'presente': ['present', 'presente'],
+    'pretérito': ['preterite', 'pretérito', 'preterito', 'past'],
+    'imperfecto': ['imperfect', 'imperfecto'],
+    'futuro': ['future', 'futuro'],
+    'condicional': ['conditional', 'condicional'],
+    'presente_subjuntivo': ['subjunctive', 'subjuntivo'],
+}
+# Conjugated forms shorter than this ("da", "son", "fue") are too often other words
+MIN_FORM_LENGTH = 4
+# Irregular forms that are also English words
+ENGLISH_WORDS = {'dais', 'dice', 'eras', 'sale', 'sales', 'vine'}
+
+
+class KeywordMatcher:
+    """Find many keywords in a text with a single left-to-right pass.
+    
+    Matches only count on whole words, so "ir" is not found inside
+    "escribir".
+    """
+    
+    def __init__(self, keywords: Iterable[Tuple[str, Any]] = ()):
+        # Trie nodes: goto transitions, failure link, (keyword, payload) outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Any]]] = [[]]
+        self._built = False
+        
+        for keyword, payload in keywords:
+            self.add(keyword, payload)
+        self.build()
+    
+    def add(self, keyword: str, payload: Any):
+        """Add a keyword; call build() before searching again"""
+        keyword = keyword.lower()
+        if not keyword:
+            return
+        
+        node = 0
+        for char in keyword:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[node][char] = nxt
+            node = nxt
+        self._out[node].append((keyword, payload))
+        self._built = False
+    
+    def build(self):
+        """Compute failure links (breadth-first over the trie)"""
+        queue = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            queue.append(node)
+        
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                # Inherit matches that end at the failure state
+                self._out[child] = self._out[child] + [
+                    o for o in self._out[self._fail[child]] if o not in self._out[child]
+                ]
+        
+        self._built = True
+    
+    def find(self, text: str) -> List[Tuple[int, int, Any]]:
+        """Return (start, end, payload) for every whole-word match, in text order"""
+        if not self._built:
+            self.build()
+        
+        text = text.lower()
+        matches = []
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            
+            for keyword, payload in self._out[node]:
+                start = i - len(keyword) + 1
+                end = i + 1
+                if _is_boundary(text, start - 1) and _is_boundary(text, end):
+                    matches.append((start, end, payload))
+        
+        matches.sort(key=lambda m: (m[0], -m[1]))
+        return matches
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """True if index is outside the text or not a letter"""
+    return index < 0 or index >= len(text) or not text[index].isalpha()
+
+
+def build_verb_matcher(infinitives: Iterable[str], forms: Iterable[Tuple[str, str]] = ()) -> KeywordMatcher:
+    """Build a matcher over infinitives, conjugated forms and tense keywords.
+    
+    Payloads are ('verb', infinitive), ('form', infinitive) or ('tense', tense).
+    Forms shorter than MIN_FORM_LENGTH or in ENGLISH_WORDS are left out,
+    so ordinary English in a message is not read as a verb.
+    """
+    keywords = [(infinitive, ('verb', infinitive)) for infinitive in infinitives]
+    keywords += [
+        (form, ('form', infinitive)) for form, infinitive in forms
+        if len(form) >= MIN_FORM_LENGTH and form.lower() not in ENGLISH_WORDS
+    ]
+    for tense, words in TENSE_KEYWORDS.items():
+        keywords += [(word, ('tense', tense)) for word in words]
+    return KeywordMatcher(keywords)
@@ -0,0 +1,107 @@
+"""
+Read-only example phrase index, shared by every session
+"""
+
+import random
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class PhraseIndex:
+    """Example phrases grouped by infinitive and CEFR level.
+    
+    The index is built from the content registry on first use and never
+    modified afterwards, so one instance can serve every session.
+    """
+    
+    def __init__(self, phrases: List[Dict] = None):
+        self._phrases = phrases
+        # (infinitive -> all phrases, infinitive -> level -> phrases), swapped as one
+        self._index: Tuple[Dict, Dict] = ({}, {})
+        self._lock = threading.Lock()
+        self.initialized = False
+    
+    def initialize(self):
+        """Load phrases and build the index (once)"""
+        if self.initialized:
+            return
+        
+        with self._lock:
+            if self.initialized:
+                return
+            
+            phrases = self._phrases
+            if phrases is None:
+                from .io import get_registry
+                phrases = get_registry().get('phrases')
+            self._build(phrases)
+            self.initialized = True
+    
+    def refresh(self, phrases: List[Dict] = None):
+        """Rebuild the index from new phrases (default: the registry's) and swap it in"""
+        if phrases is None:
+            from .io import get_registry
+            phrases = get_registry().get('phrases')
+        with self._lock:
+            self._phrases = phrases
+            self._build(phrases)
+            self.initialized = True
+    
+    def _build(self, phrases: List[Dict]):
+        """Group phrases by verb and level, then install both lookups at once"""
+        by_level = {}
+        for phrase in phrases:
+            verb = phrase.get('infinitive', '').lower()
+            level = phrase.get('level', '').upper()
+            by_level.setdefault(verb, {}).setdefault(level, []).append(phrase)
+        
+        by_level = {
+            verb: {level: tuple(items) for level, items in levels.items()}
+            for verb, levels in by_level.items()
+        }
+        by_verb = {
+            verb: tuple(p for items in levels.values() for p in items)
+            for verb, levels in by_level.items()
+        }
+        # One assignment, so readers never see lookups from two different builds
+        self._index = (by_verb, by_level)
+    
+    def get(self, infinitive: str, level: Optional[str] = None) -> Tuple[Dict, ...]:
+        """Get the phrases for a verb, optionally at one CEFR level"""
+        self.initialize()
+        by_verb, by_level = self._index
+        infinitive = infinitive.lower()
+        if level is None:
+            return by_verb.get(infinitive, ())
+        return by_level.get(infinitive, {}).get(level.upper(), ())
+    
+    def sample(self, infinitive: str, count: int = 3, level: Optional[str] = None) -> List[Dict]:
+        """Pick up to count random phrases for a verb.
+        
+        With a level, phrases at that level are preferred; if there are
+        none, phrases from any level are used.
+        """
+        candidates = self.get(infinitive, level) if level else ()
+        if not candidates:
+            candidates = self.get(infinitive)
+        return random.sample(candidates, min(count, len(candidates)))
+    
+    def levels(self, infinitive: str) -> List[str]:
+        """CEFR levels that have phrases for a verb"""
+        self.initialize()
+        _, by_level = self._index
+        return sorted(by_level.get(infinitive.lower(), {}))
+
+
+_shared_phrases = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_phrases() -> PhraseIndex:
+    """Get the process-wide phrase index (built lazily on first lookup)"""
+    global _shared_phrases
+    if _shared_phrases is None:
+        with _shared_lock:
+            if _shared_phrases is None:
+                _shared_phrases = PhraseIndex()
+    return _shared_phrases
@@ -2,73 +2,267 @@
 Spaced Repetition System (SRS) Manager using Leitner boxes
 """
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import json
 
+CardKey = Tuple[str, str, str]
+
 
 class SRSManager:
-    """Leitner-style spaced repetition system"""
-    
-    def __init__(self):
-        self.boxes = {
-            1: [],  # Daily review
-            2: [],  # Every 2 days
-            3: [],  # Every 4 days
-            4: [],  # Every 7 days
-            5: []   # Every 14 days
-        }
+    """Leitner-style spaced repetition system.
+    
+    Cards are stored column-wise: verb/tense/person are interned to small
+    integer IDs and each card is one slot across compact arrays. Use
+    get_card(), iter_cards() or boxes to get cards in the usual dict form.
+    
+    An optional store (e.g. SQLiteSRSStore) receives a write for every
+    changed card and serves get_due_cards. clock is a callable returning
+    the current datetime (default datetime.now); pass a fake one to
+    replay reviews in simulated time.
+    """
+    
+    def __init__(self, store=None, clock: Callable[[], datetime] = None):
         self.box_intervals = {
-            1: 1,
-            2: 2,
-            3: 4,
-            4: 7,
-            5: 14
+            1: 1,   # Daily review
+            2: 2,   # Every 2 days
+            3: 4,   # Every 4 days
+            4: 7,   # Every 7 days
+            5: 14   # Every 14 days
         }
+        self.store = store
+        self.clock = clock or datetime.now
+        self._clear()
+        
+        if store is not None:
+            for row in store.load_cards():
+                self._upsert(_card_key(row), row['box'], row['next_review'],
+                             row['correct_count'], row['total_attempts'], index=False)
+            self._rebuild_due_index()
+            self._rebuild_stats()
+    
+    def _clear(self):
+        """Drop all cards and statistics"""
+        self._box_counts = {box: 0 for box in self.box_intervals}
+        # Interned names and their IDs
+        self._verbs: List[str] = []
+        self._tenses: List[str] = []
+        self._persons: List[str] = []
+        self._verb_ids: Dict[str, int] = {}
+        self._tense_ids: Dict[str, int] = {}
+        self._person_ids: Dict[str, int] = {}
+        # One slot per card across these columns
+        self._verb_col = array('I')
+        self._tense_col = array('B')
+        self._person_col = array('B')
+        self._box_col = array('B')
+        self._due_col = array('d')       # next_review as a timestamp
+        self._correct_col = array('I')
+        self._attempts_col = array('I')
+        # Packed (verb, tense, person) IDs -> slot
+        self._slots: Dict[int, int] = {}
+        # Due index: parallel arrays sorted by due timestamp
+        self._due_times = array('d')
+        self._due_slots = array('I')
+        # Per-box sorted due timestamps, kept alongside the due index for forecast()
+        self._box_due: Dict[int, array] = {box: array('d') for box in self.box_intervals}
+        # Running [correct, attempts] per verb/tense/person, and verbs with
+        # attempts sorted by (mastery, verb) for the weakest-first lookups
+        self._verb_stats: Dict[str, List[int]] = {}
+        self._tense_stats: Dict[str, List[int]] = {}
+        self._person_stats: Dict[str, List[int]] = {}
+        self._weak_verbs: List[Tuple[float, str]] = []
+    
+    def __len__(self) -> int:
+        return len(self._box_col)
+    
+    @property
+    def boxes(self) -> Dict[int, List[Dict]]:
+        """Cards grouped by box, as dicts"""
+        boxes = {box: [] for box in self._box_counts}
+        for slot in range(len(self._box_col)):
+            boxes[self._box_col[slot]].append(self._card(slot))
+        return boxes
+    
+    def add_card(self, verb: str, tense: str, person: str, box: int = 1) -> bool:
+        """Add a card to a box; returns False if it already exists"""
+        if box not in self.box_intervals or self._find_slot(verb, tense, person) is not None:
+            return False
         
-    def add_card(self, verb: str, tense: str, person: str, box: int = 1):
-        """Add a card to a box"""
-        card = {
-            'verb': verb,
-            'tense': tense,
-            'person': person,
-            'next_review': datetime.now().isoformat(),
-            'correct_count': 0,
-            'total_attempts': 0
+        slot = self._new_slot(verb, tense, person, box, self.clock().timestamp(), 0, 0)
+        if self.store is not None:
+            self.store.save_card(self._row(slot))
+        return True
+    
+    def add_cards_bulk(self, deck: Dict, persons: Iterable[str], box: int = 1) -> int:
+        """Add a card for every verb x tense x person in a deck; returns how many were new.
+
+        deck is a study deck with 'verbs' and 'tenses' lists; existing cards are kept.
+        """
+        if box not in self.box_intervals:
+            return 0
+        
+        now = self.clock().timestamp()
+        persons = list(persons)
+        new_slots = array('I')
+        for verb in deck.get('verbs', []):
+            for tense in deck.get('tenses', []):
+                for person in persons:
+                    if self._find_slot(verb, tense, person) is None:
+                        new_slots.append(self._new_slot(verb, tense, person, box, now, 0, 0, index=False))
+        
+        # All new cards share one due time, so they go into the due index as one block
+        i = bisect_right(self._due_times, now)
+        self._due_times[i:i] = array('d', [now]) * len(new_slots)
+        self._due_slots[i:i] = new_slots
+        times = self._box_due.setdefault(box, array('d'))
+        i = bisect_right(times, now)
+        times[i:i] = array('d', [now]) * len(new_slots)
+        
+        if self.store is not None and new_slots:
+            self.store.save_cards(self._row(slot) for slot in new_slots)
+        return len(new_slots)
+    
+    def has_card(self, verb: str, tense: str, person: str) -> bool:
+        """Check whether a card exists"""
+        return self._find_slot(verb, tense, person) is not None
+    
+    def get_card(self, verb: str, tense: str, person: str) -> Optional[Dict]:
+        """Get a card as a dict, or None"""
+        slot = self._find_slot(verb, tense, person)
+        return self._card(slot) if slot is not None else None
+    
+    def iter_cards(self) -> Iterator[Dict]:
+        """Yield every card as a dict, including its box"""
+        for slot in range(len(self._box_col)):
+            yield {**self._card(slot), 'box': self._box_col[slot]}
+    
+    def _card(self, slot: int) -> Dict:
+        """Convert a slot to the card dict format"""
+        return {
+            'verb': self._verbs[self._verb_col[slot]],
+            'tense': self._tenses[self._tense_col[slot]],
+            'person': self._persons[self._person_col[slot]],
+            'next_review': datetime.fromtimestamp(self._due_col[slot]).isoformat(),
+            'correct_count': self._correct_col[slot],
+            'total_attempts': self._attempts_col[slot]
         }
+    
+    def _row(self, slot: int) -> Dict:
+        """Convert a slot to a store row (next_review as a timestamp)"""
+        return {
+            'verb': self._verbs[self._verb_col[slot]],
+            'tense': self._tenses[self._tense_col[slot]],
+            'person': self._persons[self._person_col[slot]],
+            'box': self._box_col[slot],
+            'next_review': self._due_col[slot],
+            'correct_count': self._correct_col[slot],
+            'total_attempts': self._attempts_col[slot]
+        }
+    
+    def _find_slot(self, verb: str, tense: str, person: str) -> Optional[int]:
+        """Look up a card's slot without interning new names"""
+        vid = self._verb_ids.get(verb)
+        tid = self._tense_ids.get(tense)
+        pid = self._person_ids.get(person)
+        if vid is None or tid is None or pid is None:
+            return None
+        return self._slots.get(_pack(vid, tid, pid))
+    
+    def _new_slot(self, verb: str, tense: str, person: str, box: int, due: float,
+                  correct_count: int, total_attempts: int, index: bool = True) -> int:
+        """Append a card to the columns and (unless index=False) the due index"""
+        vid = _intern(verb, self._verbs, self._verb_ids)
+        tid = _intern(tense, self._tenses, self._tense_ids)
+        pid = _intern(person, self._persons, self._person_ids)
+        
+        slot = len(self._box_col)
+        self._verb_col.append(vid)
+        self._tense_col.append(tid)
+        self._person_col.append(pid)
+        self._box_col.append(box)
+        self._due_col.append(due)
+        self._correct_col.append(correct_count)
+        self._attempts_col.append(total_attempts)
+        self._slots[_pack(vid, tid, pid)] = slot
+        self._box_counts[box] = self._box_counts.get(box, 0) + 1
+        
+        if index:
+            i = bisect_right(self._due_times, due)
+            self._due_times.insert(i, due)
+            self._due_slots.insert(i, slot)
+            insort(self._box_due.setdefault(box, array('d')), due)
+        return slot
+    
+    def _reschedule(self, slot: int, box: int, due: float, index: bool = True):
+        """Move a card to another box and due time"""
+        old_box = self._box_col[slot]
+        self._box_counts[old_box] -= 1
+        self._box_counts[box] = self._box_counts.get(box, 0) + 1
+        self._box_col[slot] = box
+        
+        if not index:
+            self._due_col[slot] = due
+            return
+        
+        times = self._box_due[old_box]
+        del times[bisect_left(times, self._due_col[slot])]
+        insort(self._box_due.setdefault(box, array('d')), due)
         
-        if box in self.boxes:
-            self.boxes[box].append(card)
+        i = bisect_left(self._due_times, self._due_col[slot])
+        while self._due_slots[i] != slot:
+            i += 1
+        del self._due_times[i]
+        del self._due_slots[i]
+        
+        self._due_col[slot] = due
+        i = bisect_right(self._due_times, due)
+        self._due_times.insert(i, due)
+        self._due_slots.insert(i, slot)
     
     def get_due_cards(self, box: int = None) -> List[Dict]:
         """Get cards due for review"""
-        now = datetime.now()
-        due_cards = []
+        now = self.clock().timestamp()
+        if self.store is not None:
+            rows = self.store.due_cards(now, box)
+            for row in rows:
+                row['next_review'] = datetime.fromtimestamp(row['next_review']).isoformat()
+            return rows
         
-        boxes_to_check = [box] if box else list(self.boxes.keys())
+        end = bisect_right(self._due_times, now)
+        due_cards = []
         
-        for b in boxes_to_check:
-            for card in self.boxes[b]:
-                next_review = datetime.fromisoformat(card['next_review'])
-                if next_review <= now:
-                    due_cards.append({**card, 'box': b})
+        for slot in self._due_slots[:end]:
+            b = self._box_col[slot]
+            if box is None or b == box:
+                due_cards.append({**self._card(slot), 'box': b})
         
         return due_cards
     
+    def get_due_count(self) -> int:
+        """Count cards due for review"""
+        return bisect_right(self._due_times, self.clock().timestamp())
+    
     def process_answer(self, card: Dict, correct: bool):
         """Process answer and move card to appropriate box"""
-        box = card.get('box', 1)
+        verb, tense, person = _card_key(card)
+        slot = self._find_slot(verb, tense, person)
+        if slot is None:
+            # Unknown card: take it as given
+            slot = self._new_slot(
+                verb, tense, person, card.get('box', 1),
+                datetime.fromisoformat(card['next_review']).timestamp(),
+                card.get('correct_count', 0), card.get('total_attempts', 0)
+            )
+        box = self._box_col[slot]
         
         # Update statistics
-        card['total_attempts'] += 1
+        self._attempts_col[slot] += 1
         if correct:
-            card['correct_count'] += 1
-        
-        # Remove from current box
-        self.boxes[box] = [c for c in self.boxes[box] 
-                          if not (c['verb'] == card['verb'] and 
-                                 c['tense'] == card['tense'] and 
-                                 c['person'] == card['person'])]
+            self._correct_col[slot] += 1
+        self._record((verb, tense, person), int(correct), 1)
         
         # Determine new box
         if correct:
@@ -78,62 +272,127 @@ class SRSManager:
         
         # Calculate next review date
         interval_days = self.box_intervals[new_box]
-        card['next_review'] = (datetime.now() + timedelta(days=interval_days)).isoformat()
+        next_review = self.clock() + timedelta(days=interval_days)
         
-        # Add to new box
-        self.boxes[new_box].append(card)
+        # Move to new box
+        self._reschedule(slot, new_box, next_review.timestamp())
+        card.update(self._card(slot), box=new_box)
+        if self.store is not None:
+            self.store.save_card(self._row(slot))
         
         return new_box
     
-    def get_mastery_level(self, verb: str) -> float:
-        """Get mastery level for a verb (0-1)"""
-        total_correct = 0
-        total_attempts = 0
+    def _record(self, key: CardKey, correct: int, attempts: int):
+        """Add results to the per-verb/tense/person aggregates"""
+        verb, tense, person = key
         
-        for box in self.boxes.values():
-            for card in box:
-                if card['verb'] == verb:
-                    total_correct += card['correct_count']
-                    total_attempts += card['total_attempts']
+        stats = self._verb_stats.setdefault(verb, [0, 0])
+        if stats[1] > 0:
+            i = bisect_left(self._weak_verbs, (stats[0] / stats[1], verb))
+            del self._weak_verbs[i]
+        stats[0] += correct
+        stats[1] += attempts
+        if stats[1] > 0:
+            insort(self._weak_verbs, (stats[0] / stats[1], verb))
         
-        if total_attempts == 0:
-            return 0.0
+        for table, name in ((self._tense_stats, tense), (self._person_stats, person)):
+            stats = table.setdefault(name, [0, 0])
+            stats[0] += correct
+            stats[1] += attempts
+    
+    def _rebuild_stats(self):
+        """Recompute all aggregates from the stored cards"""
+        self._verb_stats = {}
+        self._tense_stats = {}
+        self._person_stats = {}
         
-        return total_correct / total_attempts
+        for slot in range(len(self._box_col)):
+            correct = self._correct_col[slot]
+            attempts = self._attempts_col[slot]
+            for table, name in ((self._verb_stats, self._verbs[self._verb_col[slot]]),
+                                (self._tense_stats, self._tenses[self._tense_col[slot]]),
+                                (self._person_stats, self._persons[self._person_col[slot]])):
+                stats = table.setdefault(name, [0, 0])
+                stats[0] += correct
+                stats[1] += attempts
+        
+        self._weak_verbs = sorted(
+            (correct / total, verb) for verb, (correct, total) in self._verb_stats.items() if total > 0
+        )
+    
+    def get_mastery_level(self, verb: str) -> float:
+        """Get mastery level for a verb (0-1)"""
+        return _mastery(self._verb_stats.get(verb))
+    
+    def get_tense_mastery(self) -> Dict[str, float]:
+        """Get mastery level per tense (0-1)"""
+        return {tense: _mastery(stats) for tense, stats in self._tense_stats.items()}
+    
+    def get_person_mastery(self) -> Dict[str, float]:
+        """Get mastery level per person (0-1)"""
+        return {person: _mastery(stats) for person, stats in self._person_stats.items()}
     
     def get_weak_verbs(self, count: int = 5) -> List[str]:
         """Get verbs with lowest mastery"""
-        verb_scores = {}
+        return [verb for _, verb in self._weak_verbs[:count]]
+    
+    def forecast(self, days: int = 14, accuracy: float = None) -> Dict:
+        """Project how many reviews fall due on each of the next days.
+
+        Cards are grouped into (box, day) cohorts by bisecting each box's
+        sorted due times at the day boundaries, so the cost depends on
+        days x boxes rather than the number of cards. Each day's due
+        cohorts then move up a box with probability accuracy (default:
+        the learner's overall accuracy so far) or down otherwise, landing
+        box_intervals days later. Overdue cards count on day 0.
+        Returns {'dates': [...], 'due': [...], 'by_box': {box: [...]}} with
+        expected (rounded) counts.
+        """
+        if accuracy is None:
+            correct = sum(stats[0] for stats in self._verb_stats.values())
+            attempts = sum(stats[1] for stats in self._verb_stats.values())
+            accuracy = correct / attempts if attempts else 1.0
         
-        for box in self.boxes.values():
-            for card in box:
-                verb = card['verb']
-                if verb not in verb_scores:
-                    verb_scores[verb] = {'correct': 0, 'total': 0}
-                
-                verb_scores[verb]['correct'] += card['correct_count']
-                verb_scores[verb]['total'] += card['total_attempts']
+        today = self.clock().replace(hour=0, minute=0, second=0, microsecond=0)
+        boxes = sorted(self.box_intervals)
+        cohorts = {box: [0.0] * days for box in boxes}
         
-        # Calculate mastery scores
-        weak_verbs = []
-        for verb, stats in verb_scores.items():
-            if stats['total'] > 0:
-                mastery = stats['correct'] / stats['total']
-                weak_verbs.append((verb, mastery))
+        # Count each box's cards due before the horizon by day
+        boundaries = [(today + timedelta(days=day + 1)).timestamp() for day in range(days)]
+        for box in boxes:
+            times = self._box_due.get(box, ())
+            start = 0
+            for day, boundary in enumerate(boundaries):
+                end = bisect_right(times, boundary, lo=start)
+                cohorts[box][day] += end - start
+                start = end
         
-        # Sort by mastery (lowest first)
-        weak_verbs.sort(key=lambda x: x[1])
+        # Roll cohorts forward: reviewed cards reappear after their new box's interval
+        lowest, highest = boxes[0], boxes[-1]
+        for day in range(days):
+            for box in boxes:
+                count = cohorts[box][day]
+                if not count:
+                    continue
+                for new_box, share in ((min(box + 1, highest), accuracy), 
+                                       (max(box - 1, lowest), 1 - accuracy)):
+                    later = day + self.box_intervals[new_box]
+                    if share and later < days:
+                        cohorts[new_box][later] += count * share
         
-        return [v[0] for v in weak_verbs[:count]]
+        by_box = {box: [round(n) for n in cohorts[box]] for box in boxes}
+        return {
+            'dates': [(today + timedelta(days=day)).date().isoformat() for day in range(days)],
+            'due': [round(sum(cohorts[box][day] for box in boxes)) for day in range(days)],
+            'by_box': by_box
+        }
     
     def get_statistics(self) -> Dict:
         """Get overall SRS statistics"""
-        total_cards = sum(len(box) for box in self.boxes.values())
-        due_cards = len(self.get_due_cards())
+        total_cards = len(self)
+        due_cards = self.get_due_count()
         
-        box_distribution = {
-            box: len(cards) for box, cards in self.boxes.items()
-        }
+        box_distribution = dict(self._box_counts)
         
         return {
             'total_cards': total_cards,
@@ -150,6 +409,178 @@ class SRSManager:
         try:
             imported = json.loads(data)
             # Convert keys to integers
-            self.boxes = {int(k): v for k, v in imported.items()}
+            boxes = {int(k): v for k, v in imported.items()}
+            self.load_boxes(boxes)
         except Exception as e:
             print(f"Failed to import SRS data: {e}")
+    
+    def load_boxes(self, boxes: Dict[int, List[Dict]]):
+        """Replace all cards with {box: [card dicts]}; a duplicated card keeps its last copy.
+        
+        Every card is parsed before anything is replaced, so a bad card
+        raises and leaves the current cards untouched.
+        """
+        rows = []
+        for box, cards in boxes.items():
+            for card in cards:
+                due = datetime.fromisoformat(card['next_review']).timestamp()
+                rows.append((_card_key(card), box, due, int(card['correct_count']), 
+                             int(card['total_attempts'])))
+        
+        self._clear()
+        for box in boxes:
+            self._box_counts.setdefault(box, 0)
+        for key, box, due, correct_count, total_attempts in rows:
+            self._upsert(key, box, due, correct_count, total_attempts, index=False)
+        
+        self._rebuild_due_index()
+        self._rebuild_stats()
+        if self.store is not None:
+            self.store.replace_all(self._row(slot) for slot in range(len(self)))
+    
+    def _upsert(self, key: CardKey, box: int, due: float, correct_count: int, 
+                total_attempts: int, index: bool = True) -> int:
+        """Insert a card or overwrite an existing one; aggregates are not updated.
+        
+        With index=False the due index is left stale for _rebuild_due_index().
+        """
+        slot = self._find_slot(*key)
+        if slot is None:
+            return self._new_slot(*key, box, due, correct_count, total_attempts, index)
+        
+        self._reschedule(slot, box, due, index)
+        self._correct_col[slot] = correct_count
+        self._attempts_col[slot] = total_attempts
+        return slot
+    
+    def _rebuild_due_index(self):
+        """Re-sort the due index from the next_review column"""
+        order = sorted(range(len(self._due_col)), key=self._due_col.__getitem__)
+        self._due_slots = array('I', order)
+        self._due_times = array('d', (self._due_col[slot] for slot in order))
+        self._box_due = {box: array('d') for box in self._box_counts}
+        for slot in order:
+            self._box_due[self._box_col[slot]].append(self._due_col[slot])
+    
+    def export_ndjson(self) -> Iterator[str]:
+        """Yield one JSON line per card (with its box), for streaming export"""
+        for slot in range(len(self)):
+            yield json.dumps({**self._card(slot), 'box': self._box_col[slot]}, ensure_ascii=False) + '\n'
+    
+    def import_ndjson(self, lines: Iterable[str], replace: bool = True) -> Dict:
+        """Import cards from JSON lines, validating each line.
+        
+        Invalid lines are skipped and counted. Valid cards are staged in a
+        separate manager first; the store is then written in one transaction
+        (clear plus inserts when replace is set) and only after that succeeds
+        are the cards applied here. If no line is valid nothing is changed.
+        """
+        staged = SRSManager(clock=self.clock)
+        skipped = 0
+        errors = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                card = _parse_card_line(line, self.box_intervals)
+            except ValueError as e:
+                skipped += 1
+                if len(errors) < 5:
+                    errors.append(f"line {number}: {e}")
+                continue
+            
+            staged._upsert(_card_key(card), card['box'], card['next_review'],
+                           card['correct_count'], card['total_attempts'], index=False)
+        
+        for error in errors:
+            print(f"Skipped SRS record: {error}")
+        imported = len(staged)
+        if not imported:
+            return {'imported': 0, 'skipped': skipped}
+        
+        if self.store is not None:
+            rows = (staged._row(slot) for slot in range(imported))
+            if replace:
+                self.store.replace_all(rows)
+            else:
+                self.store.save_cards(rows)
+        
+        if replace:
+            self._clear()
+        for slot in range(imported):
+            row = staged._row(slot)
+            self._upsert(_card_key(row), row['box'], row['next_review'],
+                         row['correct_count'], row['total_attempts'], index=False)
+        self._rebuild_due_index()
+        self._rebuild_stats()
+        
+        return {'imported': imported, 'skipped': skipped}
+
+
+def _card_key(card: Dict) -> CardKey:
+    """Identify a card by verb, tense and person"""
+    return (card['verb'], card['tense'], card['person'])
+
+
+def _parse_card_line(line: str, box_intervals: Dict[int, int]) -> Dict:
+    """Parse and validate one NDJSON card; next_review becomes a timestamp"""
+    try:
+        card = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON ({e.msg})")
+    if not isinstance(card, dict):
+        raise ValueError("not a JSON object")
+    
+    for field in ('verb', 'tense', 'person'):
+        if not isinstance(card.get(field), str) or not card[field]:
+            raise ValueError(f"missing {field}")
+    
+    # type() rather than isinstance(): true and 2.0 would pass as 1 and 2
+    box = card.get('box', 1)
+    if type(box) is not int or box not in box_intervals:
+        raise ValueError(f"unknown box {box!r}")
+    
+    # Counts are stored in unsigned 32-bit columns
+    counts = []
+    for field in ('correct_count', 'total_attempts'):
+        value = card.get(field, 0)
+        if type(value) is not int or not 0 <= value < 2 ** 32:
+            raise ValueError(f"bad {field} {value!r}")
+        counts.append(value)
+    
+    next_review = card.get('next_review')
+    try:
+        due = datetime.fromisoformat(next_review).timestamp()
+    except (TypeError, ValueError):
+        raise ValueError(f"bad next_review {next_review!r}")
+    
+    return {
+        'verb': card['verb'],
+        'tense': card['tense'],
+        'person': card['person'],
+        'box': box,
+        'next_review': due,
+        'correct_count': counts[0],
+        'total_attempts': counts[1]
+    }
+
+
+def _pack(verb_id: int, tense_id: int, person_id: int) -> int:
+    """Pack interned IDs into one int key"""
+    return (verb_id << 16) | (tense_id << 8) | person_id
+
+
+def _intern(name: str, names: List[str], ids: Dict[str, int]) -> int:
+    """Get the ID for a name, assigning the next one if new"""
+    i = ids.get(name)
+    if i is None:
+        i = ids[name] = len(names)
+        names.append(name)
+    return i
+
+
+def _mastery(stats: List[int]) -> float:
+    """Correct/attempts ratio, or 0.0 with no attempts"""
+    if not stats or stats[1] == 0:
+        return 0.0
+    return stats[0] / stats[1]
@@ -0,0 +1,95 @@
+"""
+SQLite persistence for SRS state
+"""
+
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    verb TEXT NOT NULL,
+    tense TEXT NOT NULL,
+    person TEXT NOT NULL,
+    box INTEGER NOT NULL,
+    next_review REAL NOT NULL,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    total_attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (verb, tense, person)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cards_due ON cards (next_review);
+"""
+
+UPSERT = """
+INSERT INTO cards (verb, tense, person, box, next_review, correct_count, total_attempts)
+VALUES (:verb, :tense, :person, :box, :next_review, :correct_count, :total_attempts)
+ON CONFLICT (verb, tense, person) DO UPDATE SET
+    box = excluded.box,
+    next_review = excluded.next_review,
+    correct_count = excluded.correct_count,
+    total_attempts = excluded.total_attempts
+"""
+
+COLUMNS = "verb, tense, person, box, next_review, correct_count, total_attempts"
+
+
+class SQLiteSRSStore:
+    """One row per card, indexed on due time.
+    
+    Rows use the card dict format except that next_review is a Unix
+    timestamp. The connection is shared across threads behind a lock.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+    
+    def save_card(self, card: Dict):
+        """Insert or update one card"""
+        with self._lock, self._conn:
+            self._conn.execute(UPSERT, card)
+    
+    def save_cards(self, cards: Iterable[Dict]):
+        """Insert or update many cards in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, cards)
+    
+    def replace_all(self, cards: Iterable[Dict]):
+        """Replace every stored card in one transaction"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cards")
+            self._conn.executemany(UPSERT, cards)
+    
+    def clear(self):
+        """Delete every stored card"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cards")
+    
+    def load_cards(self) -> Iterator[Dict]:
+        """Yield every stored card"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {COLUMNS} FROM cards").fetchall()
+        for row in rows:
+            yield dict(row)
+    
+    def due_cards(self, now: float, box: int = None) -> List[Dict]:
+        """Get cards due at or before now, soonest first"""
+        query = f"SELECT {COLUMNS} FROM cards WHERE next_review <= ?"
+        params = [now]
+        if box is not None:
+            query += " AND box = ?"
+            params.append(box)
+        query += " ORDER BY next_review"
+        
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
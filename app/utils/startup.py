@@ -0,0 +1,139 @@
+"""
+Startup profiler: import and first-render times per page and per module
+
+Enable with STARTUP_PROFILE=1. Pages call begin_page() before their own
+imports and end_page() as their last statement; the report is printed to
+the server log and shown in the sidebar.
+"""
+
+import os
+import sys
+import threading
+import time
+from importlib.abc import Loader, MetaPathFinder
+from typing import Dict, List, Optional, Tuple
+
+ENABLED = os.environ.get('STARTUP_PROFILE', '') not in ('', '0')
+
+# Reference point for "time since start" (first import of this module)
+_origin = time.perf_counter()
+_lock = threading.Lock()
+# module -> (inclusive seconds, self seconds), in import order
+_modules: Dict[str, Tuple[float, float]] = {}
+# page -> {'imports', 'first_render', 'since_start'} for the first run of each page
+_pages: Dict[str, Dict[str, float]] = {}
+_running: Dict[str, Tuple[float, float]] = {}
+_local = threading.local()
+
+
+class _TimedLoader(Loader):
+    """Wraps a module's loader to time its execution"""
+    
+    def __init__(self, loader: Loader):
+        self.loader = loader
+    
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+    
+    def exec_module(self, module):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with _lock:
+                _modules[module.__name__] = (elapsed, elapsed - children)
+    
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    """Meta path hook that hands out timed loaders"""
+    
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+_finder: Optional[_TimingFinder] = None
+
+
+def install():
+    """Start timing module imports (no-op unless profiling is enabled)"""
+    global _finder
+    if not ENABLED or _finder is not None:
+        return
+    _finder = _TimingFinder()
+    sys.meta_path.insert(0, _finder)
+
+
+def begin_page(page: str):
+    """Mark the start of a page script run (call before the page's imports)"""
+    if not ENABLED or page in _pages:
+        return
+    install()
+    with _lock:
+        _running[page] = (time.perf_counter(), 0.0)
+
+
+def page_imported(page: str):
+    """Mark the end of a page's imports"""
+    if page in _running:
+        started, _ = _running[page]
+        _running[page] = (started, time.perf_counter() - started)
+
+
+def end_page(page: str):
+    """Mark the end of a page's first render and log the report"""
+    if page not in _running:
+        return
+    started, imports = _running.pop(page)
+    now = time.perf_counter()
+    with _lock:
+        _pages[page] = {
+            'imports': imports,
+            'first_render': now - started,
+            'since_start': now - _origin
+        }
+    print(report())
+
+
+def slowest_modules(count: int = 15) -> List[Tuple[str, float, float]]:
+    """(module, inclusive seconds, self seconds), slowest self time first"""
+    with _lock:
+        items = [(name, total, own) for name, (total, own) in _modules.items()]
+    return sorted(items, key=lambda item: item[2], reverse=True)[:count]
+
+
+def report(count: int = 15) -> str:
+    """Text report of page timings and the slowest module imports"""
+    lines = ["Startup profile (ms)", f"{'page':<12} {'imports':>8} {'render':>8} {'since start':>12}"]
+    for page, times in _pages.items():
+        lines.append(f"{page:<12} {times['imports'] * 1000:>8.1f} {times['first_render'] * 1000:>8.1f} "
+                     f"{times['since_start'] * 1000:>12.1f}")
+    lines.append(f"{'module':<40} {'total':>8} {'self':>8}")
+    for name, total, own in slowest_modules(count):
+        lines.append(f"{name:<40} {total * 1000:>8.1f} {own * 1000:>8.1f}")
+    return "\n".join(lines)
+
+
+def render_sidebar(st):
+    """Show the report in the sidebar when profiling is enabled"""
+    if ENABLED and _pages:
+        with st.sidebar.expander("⏱️ Startup profile"):
+            st.code(report(), language=None)
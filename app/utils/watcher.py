@@ -0,0 +1,95 @@
+"""
+Content watcher: hot-reload edited content files without a restart
+"""
+
+import os
+import threading
+from typing import Callable, List, Optional
+
+from .io import ContentRegistry, get_registry
+
+# Seconds between mtime polls; set CONTENT_POLL_SECONDS=0 to disable watching
+DEFAULT_INTERVAL = float(os.environ.get('CONTENT_POLL_SECONDS', '2'))
+
+
+class ContentWatcher:
+    """Poll content file mtimes and push changed files to listeners.
+    
+    Each poll re-reads only the files that changed (registry.refresh())
+    and calls every listener with their registry names. Polling runs on a
+    daemon thread, so request threads never wait on a reload.
+    """
+    
+    def __init__(self, registry: ContentRegistry = None, interval: float = DEFAULT_INTERVAL):
+        self.registry = registry or get_registry()
+        self.interval = interval
+        self.listeners: List[Callable[[List[str]], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def add_listener(self, listener: Callable[[List[str]], None]):
+        """Call listener(changed_names) after changed files are re-read"""
+        self.listeners.append(listener)
+    
+    def check(self) -> List[str]:
+        """Poll once; returns the names of the files that were reloaded"""
+        changed = self.registry.refresh()
+        if changed:
+            print(f"✓ Content changed: {', '.join(changed)}")
+            for listener in self.listeners:
+                try:
+                    listener(changed)
+                except Exception as e:
+                    # Keep serving the previous content rather than killing the watcher
+                    print(f"Warning: content reload failed: {e}")
+        return changed
+    
+    def start(self):
+        """Start polling in the background (no-op if already running or disabled)"""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="content-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop polling"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except OSError as e:
+                print(f"Warning: content watcher could not read files: {e}")
+
+
+_watcher: Optional[ContentWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def start_content_watcher(engine=None) -> ContentWatcher:
+    """Start the process-wide watcher that refreshes the shared engine and phrases"""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            from .phrases import get_shared_phrases
+            
+            watcher = ContentWatcher()
+            if engine is not None:
+                watcher.add_listener(engine.refresh)
+            
+            phrases = get_shared_phrases()
+            
+            def refresh_phrases(changed: List[str]):
+                # An index nobody has used yet will load the new file when first used
+                if 'phrases' in changed and phrases.initialized:
+                    phrases.refresh()
+            
+            watcher.add_listener(refresh_phrases)
+            watcher.start()
+            _watcher = watcher
+        return _watcher
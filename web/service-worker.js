@@ -1,6 +1,6 @@
 // service-worker.js - Service Worker for offline functionality
 
-const CACHE_NAME = 'spanishverb-v1';
+const CACHE_NAME = 'spanishverb-a57711016109';
 const urlsToCache = [
     '/',
     '/index.html',